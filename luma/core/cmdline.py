@@ -177,6 +177,7 @@ class make_interface(object):
         from luma.core.interface.serial import ftdi_spi
         return ftdi_spi(device=self.opts.ftdi_device,
                         bus_speed_hz=self.opts.spi_bus_speed,
+                        transfer_size=self.opts.spi_transfer_size,
                         gpio_DC=self.opts.gpio_data_command,
                         gpio_RST=self.opts.gpio_reset)
 
@@ -188,6 +189,17 @@ class make_interface(object):
         from luma.core.interface.serial import pcf8574
         return pcf8574(port=self.opts.i2c_port, address=self.opts.i2c_address)
 
+    def tca9548a(self):
+        from luma.core.interface.serial import tca9548a
+        return tca9548a(channel=self.opts.mux_channel,
+                        port=self.opts.i2c_port,
+                        address=self.opts.i2c_address,
+                        mux_address=int(str(self.opts.mux_address), 0))
+
+    def recorder(self):
+        from luma.core.interface.serial import recorder
+        return recorder(file=self.opts.record_file)
+
     def bitbang_6800(self):
         from luma.core.interface.parallel import bitbang_6800
         GPIO = self.__init_alternative_GPIO()
@@ -299,17 +311,22 @@ def create_parser(description):
     i2c_group = parser.add_argument_group('I2C')
     i2c_group.add_argument('--i2c-port', type=int, default=1, help='I2C bus number')
     i2c_group.add_argument('--i2c-address', type=str, default='0x3C', help='I2C display address')
+    i2c_group.add_argument('--mux-channel', type=int, default=0, help='I2C multiplexer channel (tca9548a interface only)')
+    i2c_group.add_argument('--mux-address', type=str, default='0x70', help='I2C multiplexer address (tca9548a interface only)')
 
     spi_group = parser.add_argument_group('SPI')
     spi_group.add_argument('--spi-port', type=int, default=0, help='SPI port number')
     spi_group.add_argument('--spi-device', type=int, default=0, help='SPI device')
     spi_group.add_argument('--spi-bus-speed', type=int, default=8000000, help='SPI max bus speed (Hz)')
-    spi_group.add_argument('--spi-transfer-size', type=int, default=4096, help='SPI bus max transfer unit (bytes)')
+    spi_group.add_argument('--spi-transfer-size', type=int, default=None, help='SPI bus max transfer unit (bytes), auto-detected from spidev if not supplied')
     spi_group.add_argument('--spi-cs-high', type=bool, default=False, help='SPI chip select is high (gpio_cs_spi driver only)')
 
     ftdi_group = parser.add_argument_group('FTDI')
     ftdi_group.add_argument('--ftdi-device', type=str, default='ftdi://::/1', help='FTDI device')
 
+    recorder_group = parser.add_argument_group('Recorder')
+    recorder_group.add_argument('--record-file', type=str, default='luma.rec', help='File to log commands and data to (recorder interface only)')
+
     linux_framebuffer_group = parser.add_argument_group('Linux framebuffer')
     linux_framebuffer_group.add_argument('--framebuffer-device', type=str, default='/dev/fd0', help='Linux framebuffer device')
 
@@ -54,6 +54,45 @@ class device(mixin.capabilities):
         """
         self._serial_interface.data(data)
 
+    async def command_async(self, *cmd):
+        """
+        Awaitable version of :func:`command`, which sends the commands on the
+        serial interface's bus thread rather than blocking the event loop.
+
+        .. versionadded:: 2.5.0
+        """
+        await mixin.run_on_bus(self._serial_interface, self.command, *cmd)
+
+    async def data_async(self, data):
+        """
+        Awaitable version of :func:`data`, which sends the data on the serial
+        interface's bus thread rather than blocking the event loop.
+
+        .. versionadded:: 2.5.0
+        """
+        await mixin.run_on_bus(self._serial_interface, self.data, data)
+
+    async def display_async(self, image):
+        """
+        Awaitable version of ``display``. Pre-processing, any framebuffer
+        comparison and the transfer itself run on the serial interface's bus
+        thread, so an asyncio render loop is not blocked for the duration of
+        the frame::
+
+            async def render(device):
+                while True:
+                    await device.display_async(next_frame())
+
+        See :py:func:`luma.core.mixin.run_on_bus` for the back-pressure and
+        cancellation behaviour.
+
+        :param image: An image to display.
+        :type image: PIL.Image.Image
+
+        .. versionadded:: 2.5.0
+        """
+        await mixin.run_on_bus(self._serial_interface, self.display, image)
+
     def show(self):
         """
         Sets the display mode ON, waking the device out of a prior
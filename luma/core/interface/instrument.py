@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Opt-in instrumentation for serial and parallel interfaces, recording how many
+bytes, transactions and how much time each :py:func:`command` and
+:py:func:`data` call costs.
+
+.. versionadded:: 2.5.0
+"""
+
+import os
+from bisect import bisect_left
+from collections import deque
+
+from luma.core import mixin
+from luma.core.util import perf_counter
+
+
+__all__ = ["instrumented"]
+
+#: Upper bounds (in seconds) of the transfer time histogram buckets.
+LATENCY_BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005,
+                   0.01, 0.05, 0.1, 0.5, 1.0, float("inf"))
+
+
+class _transfer_stats(object):
+    """
+    Counters and a transfer time histogram for one kind of transfer.
+    """
+    def __init__(self, sample_size):
+        self.transactions = 0
+        self.bytes = 0
+        self.time = 0.0
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.samples = deque(maxlen=sample_size)
+
+    def record(self, nbytes, elapsed):
+        self.transactions += 1
+        self.bytes += nbytes
+        self.time += elapsed
+        self.buckets[bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+        self.samples.append(elapsed)
+
+    def percentile(self, q):
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[int(round(q * (len(ordered) - 1)))]
+
+    def summary(self):
+        return {
+            "transactions": self.transactions,
+            "bytes": self.bytes,
+            "time": self.time,
+            "bytes_per_second": self.bytes / self.time if self.time else None,
+            "p50": self.percentile(0.5),
+            "p99": self.percentile(0.99),
+        }
+
+
+class instrumented(mixin.asynchronous):
+    """
+    Wraps a serial (or parallel) interface, passing every :py:func:`command`
+    and :py:func:`data` call through to it while recording the number of bytes
+    and transactions, the number of command/data mode switches (D/C toggles on
+    SPI, control byte changes on I²C) and the time taken by each call.
+
+    Any other attribute access is delegated to the wrapped interface, so an
+    instrumented interface can be handed to a device in place of the
+    original::
+
+        serial = instrumented(spi(port=0, device=0))
+        device = ssd1351(serial)
+        ...
+        device.display(image)
+        serial.frame()
+        print(serial.stats())
+
+    :param serial_interface: The interface to wrap.
+    :param sample_size: The number of most recent transfer times per kind to
+        retain for calculating percentiles (default: 1024).
+    :type sample_size: int
+
+    .. versionadded:: 2.5.0
+    """
+    def __init__(self, serial_interface, sample_size=1024):
+        self._serial_interface = serial_interface
+        self._sample_size = sample_size
+        # Async transfers stay in order with those made on the wrapped interface
+        self._bus_executor = mixin.bus_executor(serial_interface)
+        self.reset()
+
+    def __getattr__(self, attr):
+        if attr == "_serial_interface":
+            raise AttributeError(attr)
+        return getattr(self._serial_interface, attr)
+
+    def reset(self):
+        """
+        Zeroes all counters and discards the recorded transfer times.
+        """
+        self._command = _transfer_stats(self._sample_size)
+        self._data = _transfer_stats(self._sample_size)
+        self._last_kind = None
+        self._mode_switches = 0
+        self._frames = 0
+
+    def command(self, *cmd):
+        start = perf_counter()
+        self._serial_interface.command(*cmd)
+        self._record(self._command, len(cmd), perf_counter() - start)
+
+    def data(self, data):
+        start = perf_counter()
+        self._serial_interface.data(data)
+        self._record(self._data, len(data), perf_counter() - start)
+
+    def _record(self, kind, nbytes, elapsed):
+        kind.record(nbytes, elapsed)
+        if self._last_kind is not None and self._last_kind is not kind:
+            self._mode_switches += 1
+        self._last_kind = kind
+
+    def frame(self):
+        """
+        Marks the end of a frame (usually called after each
+        ``device.display()``), so that per-frame averages can be reported.
+        """
+        self._frames += 1
+
+    def stats(self):
+        """
+        Returns a snapshot of the recorded counters. The ``command`` and
+        ``data`` entries each report ``transactions``, ``bytes``, ``time``
+        (total seconds spent transferring), ``bytes_per_second`` and the
+        ``p50`` and ``p99`` transfer times in seconds.
+
+        :rtype: dict
+        """
+        transactions = self._command.transactions + self._data.transactions
+        return {
+            "command": self._command.summary(),
+            "data": self._data.summary(),
+            "mode_switches": self._mode_switches,
+            "frames": self._frames,
+            "transactions_per_frame": transactions / self._frames if self._frames else None,
+        }
+
+    def prometheus(self, name="luma_serial", labels=None):
+        """
+        Renders the recorded counters in the Prometheus text exposition format.
+
+        :param name: Metric name prefix.
+        :type name: str
+        :param labels: Extra labels to attach to every sample, e.g.
+            ``{"display": "status"}``.
+        :type labels: dict
+        :rtype: str
+        """
+        base = dict(labels or {})
+
+        def fmt(extra=None):
+            merged = dict(base, **(extra or {}))
+            if not merged:
+                return ""
+            pairs = ",".join(f'{k}="{v}"' for k, v in sorted(merged.items()))
+            return "{" + pairs + "}"
+
+        kinds = (("command", self._command), ("data", self._data))
+        lines = [f"# TYPE {name}_transactions_total counter"]
+        for kind_name, kind in kinds:
+            lines.append(f"{name}_transactions_total{fmt({'kind': kind_name})} {kind.transactions}")
+
+        lines.append(f"# TYPE {name}_bytes_total counter")
+        for kind_name, kind in kinds:
+            lines.append(f"{name}_bytes_total{fmt({'kind': kind_name})} {kind.bytes}")
+
+        lines.append(f"# TYPE {name}_transfer_seconds histogram")
+        for kind_name, kind in kinds:
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, kind.buckets):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{name}_transfer_seconds_bucket{fmt({'kind': kind_name, 'le': le})} {cumulative}")
+            lines.append(f"{name}_transfer_seconds_sum{fmt({'kind': kind_name})} {kind.time}")
+            lines.append(f"{name}_transfer_seconds_count{fmt({'kind': kind_name})} {kind.transactions}")
+
+        lines.append(f"# TYPE {name}_mode_switches_total counter")
+        lines.append(f"{name}_mode_switches_total{fmt()} {self._mode_switches}")
+        lines.append(f"# TYPE {name}_frames_total counter")
+        lines.append(f"{name}_frames_total{fmt()} {self._frames}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, path, name="luma_serial", labels=None):
+        """
+        Writes the output of :py:func:`prometheus` to ``path``, replacing the
+        file atomically so that it is suitable for the node exporter's
+        textfile collector.
+
+        :param path: Destination file.
+        :type path: str
+        """
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as fp:
+            fp.write(self.prometheus(name, labels))
+        os.replace(tmp, path)
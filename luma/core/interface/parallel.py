@@ -7,7 +7,7 @@ Encapsulates sending commands and data over a parallel-bus interface.
 """
 
 from time import sleep
-from luma.core import lib
+from luma.core import lib, mixin
 
 
 __all__ = ["bitbang_6800"]
@@ -21,7 +21,7 @@ PULSE_TIME = 1e-6 * 50
 
 
 @lib.rpi_gpio
-class bitbang_6800(object):
+class bitbang_6800(mixin.asynchronous):
     """
     Implements a 6800 style parallel-bus interface that provides :py:func:`data`
     and :py:func:`command` methods. The default pin assignments provided are
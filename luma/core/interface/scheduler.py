@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Coordinates several displays which share a single I²C bus, optionally behind
+a TCA9548A-style multiplexer.
+
+.. versionadded:: 2.5.0
+"""
+
+import errno
+import heapq
+from itertools import count
+from threading import RLock
+
+import luma.core.error
+from luma.core import mixin
+from luma.core.interface.serial import i2c
+from luma.core.util import perf_counter
+
+
+__all__ = ["shared_bus"]
+
+
+class _client(object):
+    """
+    An *smbus*-compatible handle onto a :py:class:`shared_bus`, which selects
+    its multiplexer channel and holds the bus lock for each transfer. Not for
+    direct public consumption.
+    """
+    def __init__(self, shared, name, channel):
+        self._shared = shared
+        self.name = name
+        self.channel = channel
+        self.transactions = 0
+        self.bytes = 0
+        self.time = 0.0
+
+    def _transfer(self, nbytes, func, *args):
+        with self._shared.lock:
+            self._shared.select(self.channel)
+            start = perf_counter()
+            result = func(*args)
+            self.time += perf_counter() - start
+            self.transactions += 1
+            self.bytes += nbytes
+            return result
+
+    def write_i2c_block_data(self, address, register, data):
+        return self._transfer(len(data) + 1, self._shared.bus.write_i2c_block_data,
+                              address, register, data)
+
+    def i2c_rdwr(self, *msgs):
+        return self._transfer(sum(len(msg) for msg in msgs), self._shared.bus.i2c_rdwr, *msgs)
+
+    def write_byte(self, address, value):
+        return self._transfer(1, self._shared.bus.write_byte, address, value)
+
+    def read_byte(self, address):
+        return self._transfer(1, self._shared.bus.read_byte, address)
+
+    def close(self):
+        # The shared bus owns the handle, see shared_bus.cleanup
+        pass
+
+    def summary(self):
+        return {
+            "channel": self.channel,
+            "transactions": self.transactions,
+            "bytes": self.bytes,
+            "time": self.time,
+            "bytes_per_second": self.bytes / self.time if self.time else None,
+        }
+
+
+class shared_bus(object):
+    """
+    Owns a single *smbus* handle on behalf of several displays, serializing
+    their transfers, switching an I²C multiplexer to the right channel only
+    when it changes, and keeping per-display throughput statistics::
+
+        shared = shared_bus(port=1)
+        left = ssd1306(shared.interface(address=0x3C, channel=0))
+        right = ssd1306(shared.interface(address=0x3C, channel=1))
+
+    Frames can also be queued with :py:func:`submit` and sent in deadline
+    and priority order by :py:func:`run_pending`, in which case only the most
+    recent pending frame for each display is sent.
+
+    :param bus: A *smbus* implementation, if ``None`` is supplied (default),
+        `smbus2 <https://pypi.org/project/smbus2>`_ is used.
+    :param port: I²C port number, usually 0 or 1 (default).
+    :type port: int
+    :param mux_address: I²C address of the multiplexer (default: ``0x70``).
+    :type mux_address: int
+    :raises luma.core.error.DeviceNotFoundError: I2C device could not be found.
+    :raises luma.core.error.DevicePermissionError: Permission to access I2C device
+        denied.
+
+    .. versionadded:: 2.5.0
+    """
+    def __init__(self, bus=None, port=1, mux_address=0x70):
+        self.lock = RLock()
+        self.mux_address = mux_address
+        self.channel = None
+        self.mux_switches = 0
+        self._clients = []
+        self._pending = []
+        self._sequence = count()
+
+        try:
+            if bus is None:
+                import smbus2
+
+                self._managed = True
+                self._i2c_msg_write = smbus2.i2c_msg.write
+                self.bus = smbus2.SMBus(port)
+            else:
+                self._managed = False
+                self._i2c_msg_write = None
+                self.bus = bus
+        except (IOError, OSError) as e:
+            if e.errno == errno.ENOENT:
+                raise luma.core.error.DeviceNotFoundError(
+                    f'I2C device not found: {e.filename}')
+            elif e.errno in [errno.EPERM, errno.EACCES]:
+                raise luma.core.error.DevicePermissionError(
+                    f'I2C device permission denied: {e.filename}')
+            else:  # pragma: no cover
+                raise
+
+    def select(self, channel):
+        """
+        Switches the multiplexer to ``channel``, unless it is already selected.
+        A channel of ``None`` denotes a device which is not behind the
+        multiplexer, and leaves it untouched.
+
+        :param channel: Multiplexer channel, 0-7.
+        :type channel: int
+        """
+        if channel is None or channel == self.channel:
+            return
+
+        assert 0 <= channel <= 7
+        with self.lock:
+            self.bus.write_byte(self.mux_address, 1 << channel)
+            self.channel = channel
+            self.mux_switches += 1
+
+    def scan(self, channels=range(8), addresses=range(0x03, 0x78)):
+        """
+        Probes every address on every multiplexer channel in a single pass
+        over the already open bus.
+
+        :param channels: Multiplexer channels to probe (default: all eight).
+        :param addresses: I²C addresses to probe on each channel (default:
+            ``0x03`` - ``0x77``); the multiplexer's own address is skipped.
+        :returns: The responding addresses, keyed by channel.
+        :rtype: dict
+        """
+        found = {}
+        with self.lock:
+            for channel in channels:
+                self.select(channel)
+                found[channel] = []
+                for address in addresses:
+                    if address == self.mux_address:
+                        continue
+                    try:
+                        self.bus.read_byte(address)
+                        found[channel].append(address)
+                    except (IOError, OSError):
+                        pass
+        return found
+
+    def client(self, name, channel=None):
+        """
+        Returns an *smbus*-compatible handle for a display on ``channel``.
+
+        :param name: Name to report statistics under.
+        :type name: str
+        :param channel: Multiplexer channel, or ``None`` if the display is
+            not behind the multiplexer.
+        :type channel: int
+        """
+        handle = _client(self, name, channel)
+        self._clients.append(handle)
+        return handle
+
+    def interface(self, address=0x3C, channel=None, name=None):
+        """
+        Creates an :py:class:`luma.core.interface.serial.i2c` interface for a
+        display at ``address`` on ``channel``, whose transfers go through
+        this shared bus.
+
+        :param address: I²C address, default: ``0x3C``.
+        :type address: int
+        :param channel: Multiplexer channel, or ``None`` if the display is
+            not behind the multiplexer.
+        :type channel: int
+        :param name: Name to report statistics under, defaults to the
+            channel and address, e.g. ``"1:0x3C"``.
+        :type name: str
+        """
+        handle = self.client(name, channel)
+        serial = i2c(bus=handle, address=address)
+        if name is None:
+            handle.name = f"{'-' if channel is None else channel}:0x{serial._addr:02X}"
+        # Async transfers for every display on the bus share one thread
+        serial._bus_executor = mixin.bus_executor(self)
+        if self._managed:
+            # Use i2c_rdwr for large blocks, as a managed i2c interface would;
+            # the client (not the interface) decides whether to close the bus
+            serial._managed = True
+            serial._i2c_msg_write = self._i2c_msg_write
+        return serial
+
+    def submit(self, func, *args, deadline=None, priority=0, key=None):
+        """
+        Queues ``func(*args)`` (typically a ``device.display`` call) to be run
+        by :py:func:`run_pending`. Tasks run in order of earliest deadline,
+        then highest priority, then submission order. A task submitted with
+        the same ``key`` as one still pending replaces it, so a slow display
+        only ever sends its latest frame.
+
+        :param deadline: Time (as given by :py:func:`luma.core.util.perf_counter`)
+            by which the task should run, or ``None`` for no deadline.
+        :type deadline: float
+        :param priority: Higher priorities run first among equal deadlines.
+        :type priority: int
+        :param key: Identifies the display, e.g. the device itself.
+        """
+        with self.lock:
+            if key is not None:
+                self._pending = [task for task in self._pending if task[3] is not key]
+                heapq.heapify(self._pending)
+            heapq.heappush(self._pending, (
+                float("inf") if deadline is None else deadline,
+                -priority,
+                next(self._sequence),
+                key,
+                func,
+                args))
+
+    def run_pending(self):
+        """
+        Runs all queued tasks while holding the bus lock.
+
+        :returns: The number of tasks that were run.
+        :rtype: int
+        """
+        ran = 0
+        with self.lock:
+            while self._pending:
+                task = heapq.heappop(self._pending)
+                task[4](*task[5])
+                ran += 1
+        return ran
+
+    def stats(self):
+        """
+        Returns the number of multiplexer channel switches and, for each
+        display, its ``channel``, ``transactions``, ``bytes``, ``time``
+        (total seconds spent transferring) and ``bytes_per_second``.
+
+        :rtype: dict
+        """
+        return {
+            "mux_switches": self.mux_switches,
+            "displays": {handle.name: handle.summary() for handle in self._clients},
+        }
+
+    def cleanup(self):
+        """
+        Closes the bus, if it was opened by this object.
+        """
+        if self._managed:
+            self.bus.close()
@@ -8,21 +8,40 @@ is I²C, SPI or bit-banging GPIO.
 """
 
 import errno
-from time import sleep
+import struct
+from contextlib import contextmanager
+from functools import partial
+from time import perf_counter_ns, sleep
 
 import luma.core.error
-from luma.core import lib
+from luma.core import lib, mixin
 
 
-__all__ = ["i2c", "noop", "spi", "gpio_cs_spi", "bitbang", "ftdi_spi", "ftdi_i2c", "pcf8574"]
+__all__ = ["i2c", "noop", "spi", "gpio_cs_spi", "bitbang", "ftdi_spi", "ftdi_i2c", "pcf8574", "recorder", "tca9548a"]
 
 #: Default amount of time to wait for a pulse to complete if the device the
 #: interface is connected to requires a pin to be 'pulsed' from low to high
 #: to low for it to accept data or a command.
 PULSE_TIME = 1e-6 * 50
 
+#: Location of the spidev kernel module's maximum transfer size (in bytes),
+#: used by :py:class:`spi` to pick a transfer size when none is given.
+SPIDEV_BUFSIZ = "/sys/module/spidev/parameters/bufsiz"
 
-class i2c(object):
+
+def _spidev_bufsiz(path=SPIDEV_BUFSIZ):
+    """
+    Reads the maximum number of bytes the spidev kernel driver will accept
+    in one transfer, or ``None`` if it cannot be determined.
+    """
+    try:
+        with open(path, "r") as fp:
+            return int(fp.read().strip())
+    except (IOError, OSError, ValueError):
+        return None
+
+
+class i2c(mixin.asynchronous):
     """
     Wrap an `I²C <https://en.wikipedia.org/wiki/I%C2%B2C>`_ (Inter-Integrated
     Circuit) interface to provide :py:func:`data` and :py:func:`command` methods.
@@ -48,6 +67,7 @@ class i2c(object):
     def __init__(self, bus=None, port=1, address=0x3C):
         self._cmd_mode = 0x00
         self._data_mode = 0x40
+        self._block_size = 4096
 
         try:
             self._addr = int(str(address), 0)
@@ -114,27 +134,32 @@ class i2c(object):
 
         # block size is the maximum data payload that will be tolerated.
         # The managed i2c will transfer blocks of upto 4K (using i2c_rdwr)
-        # whereas we must use the default 32 byte block size when unmanaged
+        # whereas we must use the default 32 byte block size when unmanaged.
+        # A block size of None means the whole payload is sent at once.
         if self._managed:
-            block_size = 4096
+            block_size = self._block_size
             write = self._write_large_block
         else:
             block_size = 32
             write = self._write_block
 
-        i = 0
         n = len(data)
+        if block_size is None or n <= block_size:
+            write(data)
+            return
+
+        i = 0
         while i < n:
-            write(list(data[i:i + block_size]))
+            write(data[i:i + block_size])
             i += block_size
 
     def _write_block(self, data):
         assert len(data) <= 32
-        self._bus.write_i2c_block_data(self._addr, self._data_mode, data)
+        self._bus.write_i2c_block_data(self._addr, self._data_mode, list(data))
 
     def _write_large_block(self, data):
-        assert len(data) <= 4096
-        self._bus.i2c_rdwr(self._i2c_msg_write(self._addr, [self._data_mode] + data))
+        assert len(data) <= self._block_size
+        self._bus.i2c_rdwr(self._i2c_msg_write(self._addr, [self._data_mode] + list(data)))
 
     def cleanup(self):
         """
@@ -145,7 +170,7 @@ class i2c(object):
 
 
 @lib.rpi_gpio
-class bitbang(object):
+class bitbang(mixin.asynchronous):
     """
     Wraps an `SPI <https://en.wikipedia.org/wiki/Serial_Peripheral_Interface_Bus>`_
     (Serial Peripheral Interface) bus to provide :py:func:`data` and
@@ -158,7 +183,7 @@ class bitbang(object):
         :py:class:`noop` implementation instead.
     :param transfer_size: Max bytes to transfer in one go. Some implementations
         only support maximum of 64 or 128 bytes, whereas RPi/py-spidev supports
-        4096 (default).
+        4096 (default, also used if ``None`` is supplied).
     :type transfer_size: int
     :param reset_hold_time: The number of seconds to hold reset active. Some devices may require
         a duration of 100ms or more to fully reset the display (default: 0)
@@ -180,7 +205,7 @@ class bitbang(object):
     """
     def __init__(self, gpio=None, transfer_size=4096, reset_hold_time=0, reset_release_time=0, **kwargs):
 
-        self._transfer_size = transfer_size
+        self._transfer_size = transfer_size or 4096
         self._managed = gpio is None
         self._gpio = gpio or self.__rpi_gpio__()
 
@@ -274,8 +299,9 @@ class spi(bitbang):
     :param bus_speed_hz: SPI bus speed, defaults to 8MHz.
     :type bus_speed_hz: int
     :param transfer_size: Maximum amount of bytes to transfer in one go. Some implementations
-        only support a maximum of 64 or 128 bytes, whereas RPi/py-spidev supports
-        4096 (default).
+        only support a maximum of 64 or 128 bytes. If ``None`` is supplied (default),
+        the spidev kernel module's ``bufsiz`` parameter is used where available,
+        falling back to 4096 otherwise.
     :type transfer_size: int
     :param gpio_DC: The GPIO pin to connect data/command select (DC) to (defaults to 24).
     :type gpio_DC: int
@@ -292,9 +318,12 @@ class spi(bitbang):
     :type reset_release_time: float
     :raises luma.core.error.DeviceNotFoundError: SPI device could not be found.
     :raises luma.core.error.UnsupportedPlatform: GPIO access not available.
+
+    .. versionchanged:: 2.5.0
+       ``transfer_size`` is auto-detected from the spidev module by default.
     """
     def __init__(self, spi=None, gpio=None, port=0, device=0,
-                 bus_speed_hz=8000000, transfer_size=4096,
+                 bus_speed_hz=8000000, transfer_size=None,
                  gpio_DC=24, gpio_RST=25, spi_mode=None,
                  reset_hold_time=0, reset_release_time=0, **kwargs):
         assert bus_speed_hz in [mhz * 1000000 for mhz in [0.5, 1, 2, 4, 8, 16, 20, 24, 28, 32, 36, 40, 44, 48, 50, 52, 60, 62, 64]]
@@ -320,6 +349,62 @@ class spi(bitbang):
 
         self._spi.max_speed_hz = bus_speed_hz
 
+        if transfer_size is None:
+            self._transfer_size = _spidev_bufsiz() or 4096
+
+        self._frame_buffer = bytearray()
+
+    def frame_buffer(self, size):
+        """
+        Returns a writable, contiguous buffer of ``size`` bytes which is
+        owned by, and reused across calls on, this interface. Drivers can
+        render pixel data into it in place (e.g. with slice assignment or
+        :py:func:`struct.pack_into`) and pass it straight to :py:func:`data`,
+        avoiding a list allocation and bytes conversion every frame.
+
+        The backing storage is only reallocated when a larger size is
+        requested, so the contents of a previously returned buffer must not
+        be relied upon after requesting a bigger one.
+
+        :param size: Number of bytes required.
+        :type size: int
+        :rtype: memoryview
+
+        .. versionadded:: 2.5.0
+        """
+        if len(self._frame_buffer) < size:
+            self._frame_buffer = bytearray(size)
+        return memoryview(self._frame_buffer)[:size]
+
+    def data(self, data):
+        """
+        Sends a data byte or sequence of data bytes through to the SPI device.
+        Bytes-like objects (``bytes``, ``bytearray``, ``memoryview``, e.g.
+        from :py:func:`frame_buffer`) are passed to the SPI implementation as
+        is, without conversion. If the data fits within :py:attr:`transfer_size`
+        bytes it is sent in a single write, otherwise it is sent as a sequence
+        of ``memoryview`` slices over the data rather than sliced copies.
+
+        :param data: A data sequence.
+        :type data: list, bytes, bytearray, memoryview
+        """
+        if self._DC:
+            self._gpio.output(self._DC, self._data_mode)
+
+        n = len(data)
+        tx_sz = self._transfer_size
+        if n <= tx_sz:
+            self._write_bytes(data)
+            return
+
+        try:
+            view = memoryview(data)
+        except TypeError:
+            view = memoryview(bytes(data))
+
+        for i in range(0, n, tx_sz):
+            self._write_bytes(view[i:i + tx_sz])
+
     def _write_bytes(self, data):
         self._spi.writebytes2(data)
 
@@ -339,10 +424,22 @@ class gpio_cs_spi(spi):
 
     :param gpio_CS: The GPIO pin to connect chip select (CS / CE) to (defaults to ``None``).
     :type gpio_CS: int
+    :param hold_cs: If ``True``, chip select is asserted once for a whole
+        :py:func:`command` or :py:func:`data` call and the ``transfer_size``
+        chunks are written back-to-back, rather than toggling chip select
+        around every chunk (default: ``False``). Use :py:func:`transaction`
+        to hold it across several calls.
+    :type hold_cs: bool
+
+    .. versionchanged:: 2.5.0
+       Added ``hold_cs`` parameter and :py:func:`transaction` method.
     """
     def __init__(self, *args, **kwargs):
         gpio_CS = kwargs.pop("gpio_CS", None)
         cs_high = kwargs.pop("cs_high", None)
+        self._hold_cs = kwargs.pop("hold_cs", False)
+        self._gpio_CS = None
+        self._cs_depth = 0
         super(gpio_cs_spi, self).__init__(*args, **kwargs)
 
         if gpio_CS:
@@ -351,15 +448,54 @@ class gpio_cs_spi(spi):
             self._spi.no_cs = True  # disable spidev's handling of the chip select pin
             self._gpio.setup(self._gpio_CS, self._gpio.OUT, initial=self._gpio.LOW if self._cs_high else self._gpio.HIGH)
 
-    def _write_bytes(self, *args, **kwargs):
-        if self._gpio_CS:
+    def _select(self):
+        if self._cs_depth == 0 and self._gpio_CS:
             self._gpio.output(self._gpio_CS, self._gpio.HIGH if self._cs_high else self._gpio.LOW)
+        self._cs_depth += 1
 
-        super(gpio_cs_spi, self)._write_bytes(*args, **kwargs)
-
-        if self._gpio_CS:
+    def _deselect(self):
+        self._cs_depth -= 1
+        if self._cs_depth == 0 and self._gpio_CS:
             self._gpio.output(self._gpio_CS, self._gpio.LOW if self._cs_high else self._gpio.HIGH)
 
+    @contextmanager
+    def transaction(self):
+        """
+        Context manager that holds chip select asserted for the duration of
+        the block, so that a sequence of :py:func:`command` and :py:func:`data`
+        calls (for example, setting a window address then streaming the
+        pixel data) costs a single chip select assert/deassert pair.
+        Transactions may be nested.
+
+        .. versionadded:: 2.5.0
+        """
+        self._select()
+        try:
+            yield self
+        finally:
+            self._deselect()
+
+    def command(self, *cmd):
+        if self._hold_cs:
+            with self.transaction():
+                super(gpio_cs_spi, self).command(*cmd)
+        else:
+            super(gpio_cs_spi, self).command(*cmd)
+
+    def data(self, data):
+        if self._hold_cs:
+            with self.transaction():
+                super(gpio_cs_spi, self).data(data)
+        else:
+            super(gpio_cs_spi, self).data(data)
+
+    def _write_bytes(self, *args, **kwargs):
+        self._select()
+        try:
+            super(gpio_cs_spi, self)._write_bytes(*args, **kwargs)
+        finally:
+            self._deselect()
+
     def cleanup(self):
         """
         Close pin if it was set up.
@@ -369,7 +505,7 @@ class gpio_cs_spi(spi):
         super(gpio_cs_spi, self).cleanup()
 
 
-class noop(object):
+class noop(mixin.asynchronous):
     """
     Does nothing, used for pseudo-devices / emulators / anything really.
     """
@@ -383,23 +519,158 @@ class noop(object):
         pass
 
 
+class recorder(mixin.asynchronous):
+    """
+    Records every :py:func:`command` and :py:func:`data` call, with a
+    timestamp, into a compact binary log while (optionally) passing the calls
+    through to another interface. Recordings can be played back with
+    :py:func:`luma.core.interface.simulator.replay`, for example against a
+    simulated bus, to benchmark device drivers without hardware.
+
+    The log starts with the 8 byte header ``LUMAREC\\x01`` followed by one
+    record per call: a little-endian ``(kind, nanoseconds, length)`` header
+    (1, 8 and 4 bytes) and then ``length`` bytes of payload, where ``kind``
+    is one of :py:attr:`COMMAND`, :py:attr:`DATA` or :py:attr:`FRAME`.
+
+    :param file: Path of the file to record to (default: ``luma.rec``), or a
+        binary file-like object.
+    :type file: str
+    :param serial_interface: The interface to pass calls on to; if ``None``
+        is supplied (default), a :py:class:`noop` interface is used.
+
+    .. versionadded:: 2.5.0
+    """
+    MAGIC = b"LUMAREC\x01"
+    RECORD = struct.Struct("<BQI")
+    COMMAND = 0
+    DATA = 1
+    FRAME = 2
+
+    def __init__(self, file="luma.rec", serial_interface=None):
+        self._managed = isinstance(file, str)
+        self._fp = open(file, "wb") if self._managed else file
+        self._serial_interface = serial_interface or noop()
+        self._start = perf_counter_ns()
+        self._fp.write(self.MAGIC)
+
+    def __getattr__(self, attr):
+        if attr == "_serial_interface":
+            raise AttributeError(attr)
+        return getattr(self._serial_interface, attr)
+
+    def command(self, *cmd):
+        self._write(self.COMMAND, bytes(cmd))
+        self._serial_interface.command(*cmd)
+
+    def data(self, data):
+        self._write(self.DATA, bytes(data))
+        self._serial_interface.data(data)
+
+    def frame(self):
+        """
+        Writes a frame marker into the log (usually after each
+        ``device.display()``), so replays can report frames per second.
+        """
+        self._write(self.FRAME, b"")
+
+    def _write(self, kind, payload):
+        self._fp.write(self.RECORD.pack(kind, perf_counter_ns() - self._start, len(payload)))
+        self._fp.write(payload)
+
+    def cleanup(self):
+        """
+        Closes the log (if it was opened from a path) and cleans up the
+        wrapped interface.
+        """
+        if self._managed:
+            self._fp.close()
+        else:
+            self._fp.flush()
+        self._serial_interface.cleanup()
+
+
 def _ftdi_pin(pin):
     return 1 << pin
 
 
+# MPSSE opcodes (see FTDI application note AN_108)
+_MPSSE_SET_BITS_LOW = 0x80
+_MPSSE_SET_BITS_HIGH = 0x82
+_MPSSE_WRITE_BYTES_NVE_MSB = 0x11
+_MPSSE_MAX_WRITE = 0x10000
+
+
 class __FTDI_WRAPPER_SPI:
     """
     Adapter for FTDI to spidev. Not for direct public consumption
+
+    Rather than issuing a USB write for every GPIO change and SPI payload,
+    pin changes and SPI writes are encoded as MPSSE commands into a single
+    buffer which is written to the device in one USB transfer when the
+    outermost :py:func:`transaction` completes (or immediately, if no
+    transaction is in progress).
     """
-    def __init__(self, controller, spi_port):
+    def __init__(self, controller, spi_port, gpio_CS, bus_speed_hz):
         self._controller = controller
         self._spi_port = spi_port
+        self._cs = _ftdi_pin(gpio_CS)
+        self._bus_speed_hz = bus_speed_hz
+        self._frequency = None
+        self._gpio = 0
+        self._depth = 0
+        self._buffer = bytearray()
 
     def open(self, port, device):
         pass
 
-    def writebytes(self, data):
-        self._spi_port.write(data)
+    @contextmanager
+    def transaction(self):
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self.flush()
+
+    def write_gpio(self, value, flush=True):
+        self._gpio = value
+        self._set_bits(self._cs)
+        if flush and self._depth == 0:
+            self.flush()
+
+    def writebytes2(self, data):
+        buf = self._buffer
+        self._set_bits(0)  # chip select is active low
+        for i in range(0, len(data), _MPSSE_MAX_WRITE):
+            chunk = data[i:i + _MPSSE_MAX_WRITE]
+            n = len(chunk) - 1
+            buf.extend((_MPSSE_WRITE_BYTES_NVE_MSB, n & 0xFF, n >> 8))
+            buf.extend(chunk)
+        self._set_bits(self._cs)
+        if self._depth == 0:
+            self.flush()
+
+    writebytes = writebytes2
+
+    def _set_bits(self, cs):
+        # SCLK idles low (SPI mode 0), all other outputs are GPIO state
+        value = self._gpio | cs
+        direction = self._controller.direction
+        self._buffer.extend((_MPSSE_SET_BITS_LOW, value & 0xFF, direction & 0xFF))
+        if direction & 0xFF00:
+            self._buffer.extend((_MPSSE_SET_BITS_HIGH, (value >> 8) & 0xFF, (direction >> 8) & 0xFF))
+
+    def flush(self):
+        if self._buffer:
+            ftdi = self._controller.ftdi
+            if self._frequency != self._bus_speed_hz:
+                ftdi.set_frequency(self._bus_speed_hz)
+                self._frequency = self._bus_speed_hz
+            # Swap the buffer out first, so that a failed write is not resent
+            # (with stale D/C and CS state) by the next flush
+            buffer, self._buffer = self._buffer, bytearray()
+            ftdi.write_data(buffer)
 
     def close(self):
         self._controller.terminate()
@@ -408,12 +679,16 @@ class __FTDI_WRAPPER_SPI:
 class __FTDI_WRAPPER_GPIO:
     """
     Adapter for FTDI to RPI.GPIO. Not for direct public consumption
+
+    Changes to the ``deferred`` pin (D/C) only matter to the SPI write that
+    follows, so they are queued into the same USB transfer as that write.
     """
     LOW = 0
     HIGH = OUT = 1
 
-    def __init__(self, gpio):
-        self._gpio = gpio
+    def __init__(self, mpsse, deferred=None):
+        self._mpsse = mpsse
+        self._deferred = deferred
         self._data = 0
 
     def setup(self, pin, direction):
@@ -425,7 +700,7 @@ class __FTDI_WRAPPER_GPIO:
         if value:
             self._data |= mask
 
-        self._gpio.write(self._data)
+        self._mpsse.write_gpio(self._data, flush=pin != self._deferred)
 
     def cleanup(self, pin):
         pass
@@ -439,21 +714,28 @@ class __FTDI_WRAPPER_I2C:
     def __init__(self, controller, i2c_port):
         self._controller = controller
         self._i2c_port = i2c_port
+        self._transactions = 0
+        self._bytes = 0
 
     def write_i2c_block_data(self, address, register, data):
         self._i2c_port.write_to(register, data)
+        self._transactions += 1
+        self._bytes += len(data) + 1
 
-    def i2c_rdwr(self, message):
-        address, data = message
-        register = data[0]
-        self.write_i2c_block_data(address, register, data[1:])
+    def stats(self, reset=False):
+        stats = {"transactions": self._transactions, "bytes": self._bytes}
+        if reset:
+            self._transactions = 0
+            self._bytes = 0
+        return stats
 
     def close(self):
         self._controller.terminate()
 
 
 def ftdi_spi(device='ftdi://::/1', bus_speed_hz=12000000, gpio_CS=3, gpio_DC=5, gpio_RST=6,
-        reset_hold_time=0, reset_release_time=0):
+        reset_hold_time=0, reset_release_time=0, transfer_size=None,
+        usb_latency_timer=None, usb_chunk_size=0):
     """
     Bridges an `SPI <https://en.wikipedia.org/wiki/Serial_Peripheral_Interface_Bus>`_
     (Serial Peripheral Interface) bus over an FTDI USB device to provide :py:func:`data` and
@@ -478,14 +760,33 @@ def ftdi_spi(device='ftdi://::/1', bus_speed_hz=12000000, gpio_CS=3, gpio_DC=5,
         a duration of 150ms or more after reset was triggered before the device can accept the
         initialization sequence (default: 0)
     :type reset_release_time: float
+    :param transfer_size: Maximum amount of bytes to transfer in one go. If ``None`` is
+        supplied (default), 65536 is used: the largest payload of a single MPSSE write command.
+    :type transfer_size: int
+    :param usb_latency_timer: The FTDI USB latency timer in milliseconds (1-255). If ``None``
+        is supplied (default), pyftdi's setting is left unchanged.
+    :type usb_latency_timer: int
+    :param usb_chunk_size: The size in bytes of each USB bulk write. If ``0`` is supplied
+        (default), the size of the FTDI device's TX FIFO is used.
+    :type usb_chunk_size: int
 
     .. versionadded:: 1.9.0
+    .. versionchanged:: 2.5.0
+       GPIO changes and SPI writes are batched into a single USB transfer
+       per call, or per ``transaction()`` block on the returned interface.
+       Added ``transfer_size``, ``usb_latency_timer`` and ``usb_chunk_size``
+       parameters.
     """
     from pyftdi.spi import SpiController
 
     controller = SpiController(cs_count=1)
     controller.configure(device)
 
+    ftdi = controller.ftdi
+    if usb_latency_timer is not None:
+        ftdi.set_latency_timer(usb_latency_timer)
+    ftdi.write_data_set_chunksize(usb_chunk_size)
+
     slave = controller.get_port(cs=gpio_CS - 3, freq=bus_speed_hz, mode=0)
     gpio = controller.get_gpio()
 
@@ -493,14 +794,17 @@ def ftdi_spi(device='ftdi://::/1', bus_speed_hz=12000000, gpio_CS=3, gpio_DC=5,
     pins = _ftdi_pin(gpio_RST) | _ftdi_pin(gpio_DC)
     gpio.set_direction(pins, pins & ((1 << gpio.width) - 1))
 
+    mpsse = __FTDI_WRAPPER_SPI(controller, slave, gpio_CS, bus_speed_hz)
     serial = spi(
-        __FTDI_WRAPPER_SPI(controller, slave),
-        __FTDI_WRAPPER_GPIO(gpio),
+        mpsse,
+        __FTDI_WRAPPER_GPIO(mpsse, deferred=gpio_DC),
+        transfer_size=transfer_size or _MPSSE_MAX_WRITE,
         gpio_DC=gpio_DC,
         gpio_RST=gpio_RST,
         reset_hold_time=reset_hold_time,
         reset_release_time=reset_release_time)
     serial._managed = True
+    serial.transaction = mpsse.transaction
     return serial
 
 
@@ -518,7 +822,14 @@ def ftdi_i2c(device='ftdi://::/1', address=0x3C):
     :type address: int
     :raises luma.core.error.DeviceAddressError: I2C device address is invalid.
 
+    Data payloads of any size are streamed to the device as a single I²C
+    transaction. The returned interface has a ``stats(reset=False)`` method
+    which reports the number of I²C transactions and bytes written so far;
+    calling it with ``reset=True`` after each frame gives per-frame counts.
+
     .. versionadded:: 1.9.0
+    .. versionchanged:: 2.5.0
+       Data is no longer split into 4096 byte transactions; added ``stats()``.
     """
     from pyftdi.i2c import I2cController
 
@@ -533,9 +844,12 @@ def ftdi_i2c(device='ftdi://::/1', address=0x3C):
 
     port = controller.get_port(addr)
 
-    serial = i2c(bus=__FTDI_WRAPPER_I2C(controller, port))
+    bus = __FTDI_WRAPPER_I2C(controller, port)
+    serial = i2c(bus=bus)
     serial._managed = True
-    serial._i2c_msg_write = lambda address, data: (address, data)
+    serial._block_size = None
+    serial._write_large_block = partial(bus.write_i2c_block_data, addr, serial._data_mode)
+    serial.stats = bus.stats
     return serial
 
 
@@ -727,3 +1041,83 @@ class pcf8574(i2c):
                     'I2C device not found on address: 0x{0:02X}'.format(self._addr))
             else:  # pragma: no cover
                 raise
+
+
+class tca9548a(mixin.asynchronous):
+    """
+    I²C interface to provide :py:func:`data` and :py:func:`command` methods
+    for a device on one channel of a TCA9548A (or compatible) multiplexer.
+
+    The currently selected channel is tracked on a shared
+    :py:class:`luma.core.interface.scheduler.shared_bus`, so the channel
+    select write to the multiplexer is skipped whenever consecutive transfers
+    target displays on the same channel. Instances created with the same
+    ``bus`` (or ``port``) and ``mux_address`` share one
+    :py:class:`luma.core.interface.scheduler.shared_bus` between them::
+
+        left = ssd1306(tca9548a(channel=0))
+        right = ssd1306(tca9548a(channel=1))
+
+    :param channel: Multiplexer channel the device is connected to, 0-7.
+    :type channel: int
+    :param bus: A *smbus* implementation or a
+        :py:class:`luma.core.interface.scheduler.shared_bus`; if ``None`` is
+        supplied (default), `smbus2 <https://pypi.org/project/smbus2>`_ is used.
+    :param port: I²C port number, usually 0 or 1 (default).
+    :type port: int
+    :param address: I²C address of the device, default: ``0x3C``.
+    :type address: int
+    :param mux_address: I²C address of the multiplexer, default: ``0x70``.
+    :type mux_address: int
+    :raises luma.core.error.DeviceAddressError: I2C device address is invalid.
+    :raises luma.core.error.DeviceNotFoundError: I2C device could not be found.
+    :raises luma.core.error.DevicePermissionError: Permission to access I2C device
+        denied.
+
+    .. versionadded:: 2.5.0
+    """
+    _shared_buses = {}
+
+    def __init__(self, channel=0, bus=None, port=1, address=0x3C, mux_address=0x70):
+        from luma.core.interface.scheduler import shared_bus
+
+        assert 0 <= channel <= 7
+        if isinstance(bus, shared_bus):
+            self._key = None
+            self.bus = bus
+        else:
+            self._key = (port if bus is None else id(bus), mux_address)
+            entry = self._shared_buses.get(self._key)
+            self.bus = entry[0] if entry else shared_bus(bus=bus, port=port, mux_address=mux_address)
+
+        self._serial_interface = self.bus.interface(address=address, channel=channel)
+        self._bus_executor = self._serial_interface._bus_executor
+
+        if self._key is not None:
+            self._shared_buses.setdefault(self._key, [self.bus, 0])[1] += 1
+
+    def __getattr__(self, attr):
+        if attr == "_serial_interface":
+            raise AttributeError(attr)
+        return getattr(self._serial_interface, attr)
+
+    def command(self, *cmd):
+        self._serial_interface.command(*cmd)
+
+    def data(self, data):
+        self._serial_interface.data(data)
+
+    def cleanup(self):
+        """
+        Closes the shared bus once the last multiplexed interface using it has
+        been cleaned up (unless a
+        :py:class:`luma.core.interface.scheduler.shared_bus` was supplied).
+        """
+        if self._key is None:
+            return
+
+        entry = self._shared_buses[self._key]
+        entry[1] -= 1
+        if entry[1] == 0:
+            del self._shared_buses[self._key]
+            entry[0].cleanup()
@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Simulated buses for benchmarking device drivers without hardware, and
+playback of logs captured with :py:class:`luma.core.interface.serial.recorder`.
+
+The simulated buses are drop-in replacements for a real interface, so a
+display driver can be exercised on plain Linux (e.g. in CI) to check that a
+rendering strategy meets a target frame rate::
+
+    serial = i2c_bus(bus_speed_hz=400000)
+    device = ssd1306(serial, framebuffer=diff_to_previous(num_segments=16))
+    for frame in frames:
+        device.display(frame)
+        serial.frame()
+    assert serial.stats()["min_fps"] >= 30
+
+.. versionadded:: 2.5.0
+"""
+
+from luma.core import mixin
+from luma.core.interface.serial import recorder
+
+
+__all__ = ["bus", "i2c_bus", "spi_bus", "read_recording", "replay"]
+
+
+class bus(mixin.asynchronous):
+    """
+    A :py:class:`luma.core.interface.serial.noop`-compatible interface which
+    discards everything sent to it, but keeps track of how long the transfers
+    would have taken on a bus with the given clock rate and a fixed latency
+    per transaction.
+
+    :param bus_speed_hz: Bus clock rate, e.g. ``400000`` for fast-mode I²C or
+        ``32000000`` for SPI at 32MHz.
+    :type bus_speed_hz: int
+    :param latency: Fixed cost in seconds of every transaction, regardless of
+        its size (default: 0).
+    :type latency: float
+
+    .. versionadded:: 2.5.0
+    """
+    def __init__(self, bus_speed_hz, latency=0):
+        assert bus_speed_hz > 0
+        self.bus_speed_hz = bus_speed_hz
+        self.latency = latency
+        self.reset()
+
+    def reset(self):
+        """
+        Zeroes the simulated time and all counters.
+        """
+        self.elapsed = 0.0
+        self.transactions = 0
+        self.bytes = 0
+        self.frames = 0
+        self.slowest_frame = 0.0
+        self._frame_start = 0.0
+        self._last_kind = None
+
+    def transfer_time(self, kind, nbytes):
+        """
+        Returns the number of seconds a single ``command`` or ``data``
+        transaction of ``nbytes`` takes. Override to model other buses; the
+        kind of the preceding transaction (or ``None``) is available as
+        ``self._last_kind``.
+
+        :param kind: Either :py:attr:`recorder.COMMAND` or :py:attr:`recorder.DATA`.
+        :param nbytes: Number of payload bytes.
+        :type nbytes: int
+        :rtype: float
+        """
+        return self.latency + nbytes * 8 / self.bus_speed_hz
+
+    def command(self, *cmd):
+        self._transfer(recorder.COMMAND, len(cmd))
+
+    def data(self, data):
+        self._transfer(recorder.DATA, len(data))
+
+    def _transfer(self, kind, nbytes):
+        self.elapsed += self.transfer_time(kind, nbytes)
+        self.transactions += 1
+        self.bytes += nbytes
+        self._last_kind = kind
+
+    def frame(self):
+        """
+        Marks the end of a frame.
+        """
+        self.frames += 1
+        self.slowest_frame = max(self.slowest_frame, self.elapsed - self._frame_start)
+        self._frame_start = self.elapsed
+
+    def stats(self):
+        """
+        Returns the simulated totals, including the achievable frames per
+        second if the bus were the only bottleneck: ``fps`` on average and
+        ``min_fps`` for the slowest frame.
+
+        :rtype: dict
+        """
+        return {
+            "transactions": self.transactions,
+            "bytes": self.bytes,
+            "elapsed": self.elapsed,
+            "frames": self.frames,
+            "fps": self.frames / self.elapsed if self.elapsed else None,
+            "min_fps": 1 / self.slowest_frame if self.slowest_frame else None,
+        }
+
+    def cleanup(self):
+        pass
+
+
+class i2c_bus(bus):
+    """
+    A simulated I²C bus, costed the way :py:class:`luma.core.interface.serial.i2c`
+    uses it: every transaction is a start condition, the address byte, a
+    control byte (command or data mode) and the payload, each byte taking 9
+    clocks including the acknowledge bit, followed by a stop condition.
+    Data larger than ``block_size`` is split into several transactions.
+
+    :param bus_speed_hz: Bus clock rate (default: 400kHz fast mode).
+    :type bus_speed_hz: int
+    :param block_size: Largest data payload per transaction, 32 for the SMBus
+        block writes used by default, 4096 when ``i2c_rdwr`` is available, or
+        ``None`` for unbounded.
+    :type block_size: int
+    :param latency: Fixed software overhead in seconds per transaction.
+    :type latency: float
+
+    .. versionadded:: 2.5.0
+    """
+    def __init__(self, bus_speed_hz=400000, block_size=32, latency=0):
+        super(i2c_bus, self).__init__(bus_speed_hz, latency)
+        self.block_size = block_size
+
+    def transfer_time(self, kind, nbytes):
+        blocks = 1
+        if kind == recorder.DATA and self.block_size and nbytes > self.block_size:
+            blocks = -(-nbytes // self.block_size)
+        # start + stop conditions, then address and control bytes per block
+        clocks = blocks * (2 + 2 * 9) + nbytes * 9
+        return blocks * self.latency + clocks / self.bus_speed_hz
+
+
+class spi_bus(bus):
+    """
+    A simulated 4-wire SPI bus, costed the way
+    :py:class:`luma.core.interface.serial.spi` uses it: 8 clocks per byte,
+    with the data split into writes of at most ``transfer_size`` bytes, each
+    of which deasserts chip select for ``cs_gap`` seconds afterwards.
+    Switching between command and data mode costs ``dc_setup`` seconds for
+    the D/C line to be changed.
+
+    :param bus_speed_hz: Bus clock rate (default: 8MHz).
+    :type bus_speed_hz: int
+    :param transfer_size: Largest payload per write (default: 4096).
+    :type transfer_size: int
+    :param cs_gap: Seconds between consecutive writes.
+    :type cs_gap: float
+    :param dc_setup: Seconds to change the D/C line.
+    :type dc_setup: float
+    :param latency: Fixed software overhead in seconds per write.
+    :type latency: float
+
+    .. versionadded:: 2.5.0
+    """
+    def __init__(self, bus_speed_hz=8000000, transfer_size=4096, cs_gap=0,
+                 dc_setup=0, latency=0):
+        super(spi_bus, self).__init__(bus_speed_hz, latency)
+        self.transfer_size = transfer_size
+        self.cs_gap = cs_gap
+        self.dc_setup = dc_setup
+
+    def transfer_time(self, kind, nbytes):
+        writes = max(1, -(-nbytes // self.transfer_size))
+        elapsed = writes * (self.latency + self.cs_gap) + nbytes * 8 / self.bus_speed_hz
+        if self._last_kind != kind:
+            elapsed += self.dc_setup
+        return elapsed
+
+
+def read_recording(file):
+    """
+    Reads a log written by :py:class:`luma.core.interface.serial.recorder`.
+
+    :param file: Path of the log, or a binary file-like object.
+    :type file: str
+    :returns: Yields ``(kind, timestamp, payload)`` tuples, where the timestamp
+        is in seconds since recording started.
+    :rtype: Generator[Tuple[int, float, bytes]]
+    """
+    if isinstance(file, str):
+        with open(file, "rb") as fp:
+            yield from read_recording(fp)
+        return
+
+    magic = file.read(len(recorder.MAGIC))
+    assert magic == recorder.MAGIC, "Not a luma recording"
+
+    header_size = recorder.RECORD.size
+    while True:
+        header = file.read(header_size)
+        if len(header) < header_size:
+            return
+        kind, timestamp, length = recorder.RECORD.unpack(header)
+        yield kind, timestamp / 1e9, file.read(length)
+
+
+def replay(file, serial_interface):
+    """
+    Plays a recording back into ``serial_interface``, which may be a
+    simulated :py:class:`bus` (to predict achievable frame rates) or a real
+    interface.
+
+    If the recording contains no frame markers, a new frame is assumed to
+    start at each command which follows a data transfer (display drivers
+    generally set up an address window before sending pixel data).
+
+    :param file: Path of the log, or a binary file-like object.
+    :type file: str
+    :param serial_interface: The interface to drive.
+    :returns: The number of frames and the originally recorded duration (in
+        seconds) as a dict.
+    :rtype: dict
+    """
+    records = list(read_recording(file))
+    explicit = any(kind == recorder.FRAME for kind, _, _ in records)
+    frame = getattr(serial_interface, "frame", lambda: None)
+
+    frames = 0
+    previous = None
+    for kind, _, payload in records:
+        if kind == recorder.FRAME:
+            frame()
+            frames += 1
+        elif kind == recorder.COMMAND:
+            if not explicit and previous == recorder.DATA:
+                frame()
+                frames += 1
+            serial_interface.command(*payload)
+        else:
+            serial_interface.data(payload)
+        previous = kind
+
+    if not explicit and previous == recorder.DATA:
+        frame()
+        frames += 1
+
+    return {
+        "frames": frames,
+        "recorded_time": records[-1][1] if records else 0.0,
+    }
@@ -2,9 +2,83 @@
 # Copyright (c) 2017-18 Richard Hull and contributors
 # See LICENSE.rst for details.
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from threading import Lock
+
 from PIL import Image
 
 
+_executor_lock = Lock()
+
+
+def bus_executor(serial_interface):
+    """
+    Returns the single-threaded executor on which blocking transfers for
+    ``serial_interface`` are run by the ``*_async`` methods, creating it on
+    first use. Using one thread per bus keeps transfers in submission order
+    without the caller having to lock.
+
+    :param serial_interface: The interface (or anything else representing a
+        bus) to return the executor for.
+    :rtype: concurrent.futures.ThreadPoolExecutor
+
+    .. versionadded:: 2.5.0
+    """
+    executor = vars(serial_interface).get("_bus_executor")
+    if executor is None:
+        with _executor_lock:
+            executor = vars(serial_interface).get("_bus_executor")
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="luma-bus")
+                # Bypass __setattr__, which noop (for one) discards
+                object.__setattr__(serial_interface, "_bus_executor", executor)
+    return executor
+
+
+async def run_on_bus(serial_interface, func, *args, **kwargs):
+    """
+    Runs ``func(*args, **kwargs)`` on the executor for ``serial_interface``
+    (see :py:func:`bus_executor`) and waits for the result without blocking
+    the event loop.
+
+    Awaiting each call applies back-pressure: a render loop which awaits its
+    updates never has more than one transfer in flight per bus. If the
+    awaiting task is cancelled before the transfer starts, the transfer is
+    dropped; once started, a transfer always runs to completion (so the
+    device is not left with a partial command sequence) while the
+    cancellation is raised in the awaiting task straight away.
+
+    .. versionadded:: 2.5.0
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(bus_executor(serial_interface),
+                                      partial(func, *args, **kwargs))
+
+
+class asynchronous(object):
+    """
+    This class should be 'mixed-in' to serial interfaces to provide awaitable
+    variants of :py:func:`command` and :py:func:`data`, which perform the
+    blocking transfer on a dedicated thread for the bus (see
+    :py:func:`run_on_bus`).
+
+    .. versionadded:: 2.5.0
+    """
+    async def command_async(self, *cmd):
+        """
+        Awaitable version of ``command``.
+        """
+        await run_on_bus(self, self.command, *cmd)
+
+    async def data_async(self, data):
+        """
+        Awaitable version of ``data``.
+        """
+        await run_on_bus(self, self.data, data)
+
+
 class capabilities(object):
     """
     This class should be 'mixed-in' to any :py:class:`luma.core.device.device`
@@ -62,6 +136,47 @@ class capabilities(object):
         angle = self.rotate * -90
         return image.rotate(angle, expand=True).crop((0, 0, self._w, self._h))
 
+    def can_scroll(self, dx, dy):
+        """
+        Should be overridden by devices whose controller can scroll its
+        contents in hardware (or move its display start line/column), to
+        return ``True`` for the offsets it can apply with :py:func:`scroll`.
+
+        :param dx: Horizontal offset in pixels.
+        :type dx: int
+        :param dy: Vertical offset in pixels.
+        :type dy: int
+        :rtype: bool
+
+        .. versionadded:: 2.5.0
+        """
+        return False
+
+    def scroll(self, dx, dy, image):
+        """
+        Moves the window onto the device's contents by ``(dx, dy)`` - so what
+        was shown at ``(dx, dy)`` is now at the origin - after which ``image``
+        is what should be displayed. Devices which support hardware scrolling
+        (see :py:func:`can_scroll`) override this to issue the scroll command
+        and then transfer just the newly exposed pixels from ``image``; by
+        default the whole image is displayed.
+
+        Callers must only use this when the device is showing the previous
+        frame, ``(dx, dy)`` is not ``(0, 0)``, and ``image`` differs from
+        that frame shifted by ``(dx, dy)`` only in the newly exposed strips.
+        Anything else changed must be sent with :py:func:`display` instead.
+
+        :param dx: Horizontal offset in pixels.
+        :type dx: int
+        :param dy: Vertical offset in pixels.
+        :type dy: int
+        :param image: The complete frame, as it should appear after scrolling.
+        :type image: PIL.Image.Image
+
+        .. versionadded:: 2.5.0
+        """
+        self.display(image)
+
     def display(self, image):
         """
         Should be overridden in sub-classed implementations.
@@ -1,52 +1,138 @@
 # -*- coding: utf-8 -*-
-# Copyright (c) 2017-18 Richard Hull and contributors
+# Copyright (c) 2017-2026 Richard Hull and contributors
 # See LICENSE.rst for details.
 
-# Adapted from http://code.activestate.com/recipes/577187-python-thread-pool/
-# Attribution: Created by Emilio Monti on Sun, 11 Apr 2010 (MIT License).
+from concurrent.futures import ThreadPoolExecutor, wait
+from threading import Lock
 
-from threading import Thread
+from luma.core.util import perf_counter
 
 
-class worker(Thread):
-    """
-    Thread executing tasks from a given tasks queue.
-    """
-    def __init__(self, tasks):
-        Thread.__init__(self)
-        self.tasks = tasks
-        self.daemon = True
-        self.start()
-
-    def run(self):
-        while True:
-            func, args, kargs = self.tasks.get()
-            func(*args, **kargs)
-            self.tasks.task_done()
+def _failed(future):
+    return not future.cancelled() and future.exception() is not None
 
 
 class threadpool:
     """
-    Pool of threads consuming tasks from a queue.
+    Pool of threads running tasks concurrently, backed by a
+    :py:class:`concurrent.futures.ThreadPoolExecutor`.
+
+    Tasks are queued without blocking the producer, an exception raised by a
+    task is re-raised by :py:func:`wait_completion` (rather than silently
+    killing a worker), and optionally the time taken by each task is recorded
+    so that slow tasks can be identified with :py:func:`timings`. The pool may
+    be used as a context manager, in which case it is shut down on exit.
+
+    :param num_threads: The maximum number of worker threads (default: 4).
+    :type num_threads: int
+    :param timed: Record task timings. As these are kept per function, this
+        holds a reference to every function (and bound method's object)
+        added, so is off by default.
+    :type timed: bool
+
+    .. versionchanged:: 2.5.0
+       Rewritten on top of :py:mod:`concurrent.futures`; ``add_task`` now
+       returns a future and no longer blocks when all the workers are busy.
     """
-    def __init__(self, num_threads):
-        try:
-            from Queue import Queue
-        except ImportError:
-            from queue import Queue
+    def __init__(self, num_threads=4, timed=False):
+        assert num_threads > 0
+        self.num_threads = num_threads
+        self.timed = timed
+        self._executor = ThreadPoolExecutor(max_workers=num_threads,
+                                            thread_name_prefix="luma-pool")
+        self._pending = []
+        self._lock = Lock()
+        self._timings = {}
 
-        self.tasks = Queue(num_threads)
-        for _ in range(num_threads):
-            worker(self.tasks)
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
 
     def add_task(self, func, *args, **kargs):
         """
         Add a task to the queue.
+
+        :returns: A future for the result of ``func(*args, **kargs)``.
+        :rtype: concurrent.futures.Future
+        """
+        future = self.submit(func, *args, **kargs)
+        with self._lock:
+            # Futures which completed (successfully, or were cancelled) have
+            # nothing left to report to wait_completion, so are not kept
+            self._pending = [f for f in self._pending if not f.done() or _failed(f)]
+            self._pending.append(future)
+        return future
+
+    def submit(self, func, *args, **kargs):
+        """
+        Runs a task on the pool like :py:func:`add_task`, but without
+        :py:func:`wait_completion` waiting for it (or re-raising its
+        exception): the caller is responsible for the returned future.
+
+        :rtype: concurrent.futures.Future
+
+        .. versionadded:: 2.5.0
         """
-        self.tasks.put((func, args, kargs))
+        if self.timed:
+            return self._executor.submit(self._run, func, args, kargs)
+        return self._executor.submit(func, *args, **kargs)
+
+    def _run(self, func, args, kargs):
+        start = perf_counter()
+        try:
+            return func(*args, **kargs)
+        finally:
+            elapsed = perf_counter() - start
+            with self._lock:
+                count, total, slowest = self._timings.get(func, (0, 0.0, 0.0))
+                self._timings[func] = (count + 1, total + elapsed, max(slowest, elapsed))
 
     def wait_completion(self):
         """
         Wait for completion of all the tasks in the queue.
+
+        :raises Exception: The first exception raised by any of the tasks
+            (in the order they were added), once all the tasks have finished.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+
+        wait(pending)
+        for future in pending:
+            if _failed(future):
+                raise future.exception()
+
+    def timings(self, reset=False):
+        """
+        Returns how long tasks took to run, keyed by the function that was
+        added (so bound methods of different objects, e.g. each hotspot's
+        ``render``, are reported separately). Only recorded if the pool was
+        created with ``timed=True``.
+
+        :param reset: Clear the timings after reading them.
+        :type reset: bool
+        :returns: A dict of ``count``, ``total`` and ``max`` (in seconds) for
+            each function.
+        :rtype: dict
+
+        .. versionadded:: 2.5.0
+        """
+        with self._lock:
+            timings = {func: {"count": count, "total": total, "max": slowest}
+                       for func, (count, total, slowest) in self._timings.items()}
+            if reset:
+                self._timings = {}
+        return timings
+
+    def shutdown(self, wait=True):
+        """
+        Stops accepting new tasks and releases the worker threads.
+
+        :param wait: Block until all queued tasks have run.
+        :type wait: bool
+
+        .. versionadded:: 2.5.0
         """
-        self.tasks.join()
+        self._executor.shutdown(wait=wait)
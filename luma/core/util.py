@@ -3,12 +3,18 @@
 # See LICENSE.rst for details.
 
 import sys
+from array import array
 from time import perf_counter_ns
 
 
 if sys.version_info.major == 3:
     unicode = str
 
+# Translation tables mapping each byte value to its high and low nibble
+# respectively, used by :py:func:`bytes_to_nibbles`.
+_HIGH_NIBBLES = bytes(b >> 4 for b in range(256))
+_LOW_NIBBLES = bytes(b & 0x0F for b in range(256))
+
 
 class mutable_string(object):
 
@@ -96,16 +102,26 @@ class observable(object):
 def from_16_to_8(data):
     """
     Utility function to take a list of 16 bit values and turn it into
-    a list of 8 bit values
+    a sequence of 8 bit values (big-endian byte order)
 
     :param data: list of 16 bit values to convert
     :type data: list
-    :return: a list of 8 bit values
-    :rtype: list
+    :return: a sequence of 8 bit values
+    :rtype: bytearray
 
     .. versionadded:: 1.16.0
+    .. versionchanged:: 2.5.0
+       Returns a ``bytearray`` rather than a ``list``.
     """
-    return [f(x) for x in data for f in (lambda x: (x & 0xFF00) >> 8, lambda x: 0xFF & x)]
+    try:
+        words = array('H', data)
+    except OverflowError:
+        # negative (or oversized) values are truncated to 16 bits
+        words = array('H', [x & 0xFFFF for x in data])
+
+    if sys.byteorder == 'little':
+        words.byteswap()
+    return bytearray(words.tobytes())
 
 
 def from_8_to_16(data):
@@ -120,8 +136,14 @@ def from_8_to_16(data):
 
     .. versionadded:: 1.16.0
     """
-    return [unsigned_16_to_signed(((data[i] & 0xFF) << 8) + (data[i + 1] & 0xFF))
-        for i in range(0, len(data), 2)] if data is not None else None
+    if data is None:
+        return None
+
+    words = array('h')
+    words.frombytes(bytes(data))
+    if sys.byteorder == 'little':
+        words.byteswap()
+    return words.tolist()
 
 
 def unsigned_16_to_signed(value):
@@ -141,16 +163,22 @@ def unsigned_16_to_signed(value):
 def bytes_to_nibbles(data):
     """
     Utility function to take a list of bytes (8 bit values) and turn it into
-    a list of nibbles (4 bit values)
+    a sequence of nibbles (4 bit values), high nibble first
 
     :param data: a list of 8 bit values that will be converted
-    :type data: list
-    :return: a list of 4 bit values
-    :rtype: list
+    :type data: list, bytes, bytearray
+    :return: a sequence of 4 bit values
+    :rtype: bytearray
 
     .. versionadded:: 1.16.0
+    .. versionchanged:: 2.5.0
+       Returns a ``bytearray`` rather than a ``list``.
     """
-    return [f(x) for x in data for f in (lambda x: x >> 4, lambda x: 0x0F & x)]
+    data = bytes(data)
+    nibbles = bytearray(len(data) * 2)
+    nibbles[0::2] = data.translate(_HIGH_NIBBLES)
+    nibbles[1::2] = data.translate(_LOW_NIBBLES)
+    return nibbles
 
 
 def perf_counter():
@@ -2,18 +2,111 @@
 # Copyright (c) 2017-2022 Richard Hull and contributors
 # See LICENSE.rst for details.
 
+import heapq
+import weakref
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, wait
+from itertools import count
 from time import sleep
 from textwrap import TextWrapper
+from threading import Event, Lock, RLock
 
 from PIL import Image, ImageDraw, ImageFont
 
 from luma.core import mixin, ansi_color
 from luma.core.threadpool import threadpool
 from luma.core.render import canvas
+from luma.core.sprite_system import framerate_regulator
 from luma.core.util import mutable_string, observable, perf_counter
 
 
-pool = threadpool(4)
+_shared_pool = None
+_shared_pool_lock = Lock()
+
+
+def shared_pool():
+    """
+    Returns the thread pool shared by all viewports which were not given
+    their own, creating it on first use (so that merely importing this module
+    does not start any threads).
+
+    .. versionadded:: 2.5.0
+    """
+    global _shared_pool
+    if _shared_pool is None:
+        with _shared_pool_lock:
+            if _shared_pool is None:
+                _shared_pool = threadpool(4)
+    return _shared_pool
+
+
+def __getattr__(name):
+    # The module-level ``pool`` used to be created at import time
+    if name == "pool":
+        return shared_pool()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _render_shared(hotspot, mode, name):
+    """
+    Runs in a worker process: renders the (pickled copy of the) hotspot into
+    the named shared memory block, returning the attributes which rendering
+    assigned so that they can be applied to the original. Everything else,
+    in particular the draw function (and whatever it is bound to), stays as
+    it is on the original.
+    """
+    from multiprocessing import shared_memory
+
+    before = dict(vars(hotspot))
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        data = hotspot.render(mode).tobytes()
+        shm.buf[:len(data)] = data
+    finally:
+        shm.close()
+    return {key: value for key, value in hotspot.__getstate__().items()
+            if key != "_fn" and (key not in before or before[key] is not value)}
+
+
+def _release_shared(*buffers):
+    for shm, _ in buffers:
+        shm.close()
+        shm.unlink()
+
+
+def _release_all_shared(buffers):
+    _release_shared(*buffers.values())
+
+
+class _render_timing(object):
+    """
+    Render times of one hotspot. Not for direct public consumption.
+    """
+    samples = 1000
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.last = None
+        self.overruns = 0
+        self._recent = deque(maxlen=self.samples)
+
+    def add(self, elapsed):
+        self.count += 1
+        self.total += elapsed
+        self.last = elapsed
+        self._recent.append(elapsed)
+
+    def summary(self, late):
+        recent = sorted(self._recent)
+        return {
+            "count": self.count,
+            "last": self.last,
+            "mean": self.total / self.count if self.count else None,
+            "p99": recent[-(-len(recent) * 99 // 100) - 1] if recent else None,
+            "overruns": self.overruns,
+            "late": late,
+        }
 
 
 def calc_bounds(xy, entity):
@@ -26,6 +119,28 @@ def calc_bounds(xy, entity):
     return [left, top, right, bottom]
 
 
+def _intersect(a, b):
+    """
+    The intersection of two ``(left, top, right, bottom)`` boxes, or ``None``
+    if they do not overlap.
+    """
+    box = (max(a[0], b[0]), max(a[1], b[1]), min(a[2], b[2]), min(a[3], b[3]))
+    return box if box[0] < box[2] and box[1] < box[3] else None
+
+
+def _hardware_scroll(device, dx, dy, image):
+    """
+    Scrolls ``device`` by ``(dx, dy)`` and displays ``image`` through the
+    device's hardware scroll support, returning ``False`` (having done
+    nothing) if it has none for that offset.
+    """
+    can_scroll = getattr(device, "can_scroll", None)
+    if can_scroll is None or can_scroll(dx, dy) is not True:
+        return False
+    device.scroll(dx, dy, image)
+    return True
+
+
 def range_overlap(a_min, a_max, b_min, b_max):
     """
     Neither range is completely greater than the other.
@@ -50,29 +165,147 @@ class viewport(mixin.capabilities):
         treated as white when displayed on monochrome devices. However, this behaviour
         can be changed by adding ``dither=True`` and the image will be converted from RGB
         space into a 1-bit monochrome image where dithering is employed to differentiate
-        colors at the expense of resolution.
+        colors at the expense of resolution. The backing image is dithered
+        once, in virtual coordinates, and then only where it is drawn on
+        again, so the pattern stays put while scrolling.
     :type dither: bool
+    :param pool: A :py:class:`luma.core.threadpool.threadpool` to render
+        hotspots with, e.g. to share one between several viewports. By default
+        the module-wide :py:func:`shared_pool` is used.
+    :type pool: luma.core.threadpool.threadpool
+    :param num_threads: If supplied (and no ``pool`` is), the viewport
+        renders its hotspots on a pool of its own of this size instead.
+    :type num_threads: int
+    :param processes: If supplied, hotspots are instead rendered by this many
+        worker processes into shared memory, and composited by the viewport,
+        so CPU-bound hotspots are not serialized by the GIL. Hotspots (including
+        their draw functions) must then be picklable, and are rendered with
+        :py:func:`hotspot.render` on a copy: attributes assigned while rendering
+        (such as a snapshot's ``last_updated``) are copied back afterwards,
+        but objects mutated in place are not. Requires Python 3.8 or later.
+    :type processes: int
+    :param frame_cache: The number of frames to keep, so that scrolling back
+        over content that has not changed since (e.g. a looping ticker) sends
+        the same frame again without any rendering. Each frame takes
+        ``device.width * device.height`` pixels of memory; the least recently
+        used frame is dropped when the cache is full, and the whole cache is
+        discarded whenever the content or any visible hotspot changes
+        (default: 0, no cache).
+    :type frame_cache: int
+    :param budget: If supplied, the most time (in seconds) a refresh waits
+        for hotspots to render. Hotspots which take longer keep showing their
+        previous content, are flagged as ``late`` in :py:func:`render_timings`,
+        and finish rendering in the background, to be shown by the first
+        refresh after they complete (or straight away, if the viewport is run
+        by a :py:class:`refresh_scheduler`). A late hotspot is not rendered
+        again until it has finished. With a budget, even a single hotspot is
+        rendered on the pool (default: ``None``, wait for every hotspot).
+    :type budget: float
+
+    The pool is only created when a refresh first needs to redraw more than
+    one hotspot at once; a single hotspot is rendered on the calling thread.
+    Only the visible part of each hotspot is composited, and a refresh which
+    would not change what is on the device (the position is unchanged, no
+    visible hotspot needs redrawing and nothing else was drawn) is skipped.
+    When the viewport has only moved, the previous frame is shifted and just
+    the newly exposed strips (and any redrawn hotspots) are copied in, see
+    :py:func:`scroll_to`. If the device supports hardware scrolling (see
+    :py:func:`luma.core.mixin.capabilities.can_scroll`), the shift is left
+    to the device.
+
+    Hotspots are indexed on a uniform grid of ``grid_size`` pixel cells, so
+    finding the visible hotspots costs in proportion to the number near the
+    window rather than the total number on the virtual canvas.
+
+    .. versionchanged:: 2.5.0
+       Added the ``pool``, ``num_threads``, ``processes``, ``frame_cache``
+       and ``budget`` parameters.
     """
-    def __init__(self, device, width, height, mode=None, dither=False):
+    grid_size = 64
+
+    def __init__(self, device, width, height, mode=None, dither=False, pool=None,
+                 num_threads=None, processes=None, frame_cache=0, budget=None):
         self.capabilities(width, height, rotate=0, mode=mode or device.mode)
         if hasattr(device, "segment_mapper"):
             self.segment_mapper = device.segment_mapper
         self._device = device
         self._backing_image = Image.new(self.mode, self.size)
         self._position = (0, 0)
-        self._hotspots = []
+        self._hotspots = {}
+        self._grid = defaultdict(set)
+        self._placements = defaultdict(int)
+        self._sequence = count()
         self._dither = dither
+        self._pool = pool
+        self._num_threads = num_threads
+        self._processes = processes
+        self._owns_pool = False
+        self._process_pool = None
+        self._shared_buffers = {}
+        weakref.finalize(self, _release_all_shared, self._shared_buffers)
+        self._rendered = {}
+        self._budget = budget
+        self._late = {}
+        self._timings = {}
+        self._dirty = True
+        self._moved = True
+        self._stale = False
+        self._generation = 0
+        self._frame_cache = OrderedDict()
+        self._frame_cache_size = frame_cache
+        self._frame = None
+        self._frame_window = None
+        self._dithered = None
+        self._undithered = []
+        self._scheduler = None
+        self._lock = RLock()
 
     def display(self, image):
         assert image.mode == self.mode
         assert image.size == self.size
 
-        self._backing_image.paste(image)
-        self.refresh()
+        with self._lock:
+            self._backing_image.paste(image)
+            self._dithered = None
+            # The hotspots' last renders are no longer what the backing image
+            # holds, so must not be pasted back when the viewport moves
+            self._rendered.clear()
+            self._dirty = True
+            self._invalidate()
+            self.refresh()
 
     def set_position(self, xy):
-        self._position = xy
-        self.refresh()
+        with self._lock:
+            if xy != self._position:
+                self._position = xy
+                self._moved = True
+            self.refresh()
+
+    def scroll_to(self, xy, fps=0, step=1):
+        """
+        Animates the viewport from its current position to ``(x, y)`` in a
+        straight line, moving up to ``step`` pixels per frame. Each frame
+        after the first is built by shifting the one before and rendering only
+        the strip that scrolled into view.
+
+        :param xy: The position to scroll to.
+        :type xy: tuple
+        :param fps: The target frame rate, or 0 (default) to scroll as fast as
+            the device allows.
+        :type fps: float
+        :param step: The most pixels to move (in either axis) per frame.
+        :type step: int
+
+        .. versionadded:: 2.5.0
+        """
+        assert step > 0
+        regulator = framerate_regulator(fps)
+        (x0, y0), (x1, y1) = self._position, xy
+        steps = -(-max(abs(x1 - x0), abs(y1 - y0)) // step)
+        for i in range(1, steps + 1):
+            with regulator:
+                self.set_position((x0 + (x1 - x0) * i // steps,
+                                   y0 + (y1 - y0) * i // steps))
 
     def add_hotspot(self, hotspot, xy):
         """
@@ -80,13 +313,28 @@ class viewport(mixin.capabilities):
         of the virtual device. If it does not then an ``AssertError`` is
         raised.
         """
-        (x, y) = xy
-        assert 0 <= x <= self.width - hotspot.width
-        assert 0 <= y <= self.height - hotspot.height
-
-        # TODO: should it check to see whether hotspots overlap each other?
-        # Is sensible to _allow_ them to overlap?
-        self._hotspots.append((hotspot, xy))
+        with self._lock:
+            xy = tuple(xy)
+            (x, y) = xy
+            assert 0 <= x <= self.width - hotspot.width
+            assert 0 <= y <= self.height - hotspot.height
+
+            # TODO: should it check to see whether hotspots overlap each other?
+            # Is sensible to _allow_ them to overlap?
+            entry = (hotspot, xy)
+            if entry in self._hotspots:
+                return
+
+            # Hotspots are composited in the order they were added
+            self._hotspots[entry] = next(self._sequence)
+            self._placements[id(hotspot)] += 1
+            for cell in self._cells(calc_bounds(xy, hotspot)):
+                self._grid[cell].add(entry)
+            self._dirty = True
+            self._invalidate()
+
+            if self._scheduler is not None:
+                self._scheduler.schedule(hotspot, xy)
 
     def remove_hotspot(self, hotspot, xy):
         """
@@ -96,9 +344,60 @@ class viewport(mixin.capabilities):
         specified hotspot is not found for ``(x, y)``, a ``ValueError`` is
         raised.
         """
-        self._hotspots.remove((hotspot, xy))
-        eraser = Image.new(self.mode, hotspot.size)
-        self._backing_image.paste(eraser, xy)
+        with self._lock:
+            xy = tuple(xy)
+            entry = (hotspot, xy)
+            if entry not in self._hotspots:
+                raise ValueError(f"{hotspot!r} not found at {xy}")
+
+            del self._hotspots[entry]
+            for cell in self._cells(calc_bounds(xy, hotspot)):
+                self._grid[cell].discard(entry)
+                if not self._grid[cell]:
+                    del self._grid[cell]
+
+            eraser = Image.new(self.mode, hotspot.size)
+            self._backing_image.paste(eraser, xy)
+            if self._dither:
+                self._undithered.append(tuple(calc_bounds(xy, hotspot)))
+            self._dirty = True
+            self._invalidate()
+
+            self._placements[id(hotspot)] -= 1
+            if not self._placements[id(hotspot)]:
+                del self._placements[id(hotspot)]
+                self._rendered.pop(id(hotspot), None)
+                self._timings.pop(id(hotspot), None)
+                self._late.pop(id(hotspot), None)
+                buffer = self._shared_buffers.pop((id(hotspot), hotspot.size), None)
+                if buffer:
+                    _release_shared(buffer)
+
+    def cleanup(self):
+        """
+        Shuts down the worker processes and releases the shared memory used
+        when rendering with ``processes``, as well as the viewport's own
+        thread pool if it was created with ``num_threads``, once any renders
+        in progress have finished. A pool passed in, or the shared pool, is
+        left running, as is the device. The viewport can still be used
+        afterwards, in which case these are created again when needed.
+
+        .. versionadded:: 2.5.0
+        """
+        with self._lock:
+            if self._process_pool is not None:
+                self._process_pool.shutdown()
+                self._process_pool = None
+            _release_all_shared(self._shared_buffers)
+            self._shared_buffers.clear()
+            if self._owns_pool:
+                self._pool.shutdown()
+                self._pool = None
+                self._owns_pool = False
+
+    def _invalidate(self):
+        self._generation += 1
+        self._frame_cache.clear()
 
     def is_overlapping_viewport(self, hotspot, xy):
         """
@@ -110,21 +409,288 @@ class viewport(mixin.capabilities):
         l2, t2, r2, b2 = calc_bounds(self._position, self._device)
         return range_overlap(l1, r1, l2, r2) and range_overlap(t1, b1, t2, b2)
 
-    def refresh(self):
-        should_wait = False
-        for hotspot, xy in self._hotspots:
-            if hotspot.should_redraw() and self.is_overlapping_viewport(hotspot, xy):
-                pool.add_task(hotspot.paste_into, self._backing_image, xy)
-                should_wait = True
+    def _cells(self, bounds):
+        """
+        The grid cells covered by the ``[left, top, right, bottom)`` bounds.
+        """
+        left, top, right, bottom = bounds
+        size = self.grid_size
+        return [(cx, cy)
+                for cy in range(top // size, (bottom - 1) // size + 1)
+                for cx in range(left // size, (right - 1) // size + 1)]
+
+    def _visible_hotspots(self, window):
+        """
+        The hotspots overlapping the ``window`` bounds, in the order they
+        were added.
+        """
+        left, top, right, bottom = window
+        candidates = set()
+        for cell in self._cells(window):
+            candidates.update(self._grid.get(cell, ()))
+
+        visible = []
+        for entry in candidates:
+            hotspot, (x, y) = entry
+            if x < right and left < x + hotspot.width and y < bottom and top < y + hotspot.height:
+                visible.append(entry)
+        return sorted(visible, key=self._hotspots.__getitem__)
+
+    def refresh(self, force=False):
+        """
+        Redraws any visible hotspots that are due, and sends the visible
+        window to the device.
+
+        :param force: Send the window to the device even if nothing appears
+            to have changed.
+        :type force: bool
 
-        if should_wait:
-            pool.wait_completion()
+        .. versionchanged:: 2.5.0
+           Skips the update when nothing has changed, unless ``force`` is set.
+        """
+        with self._lock:
+            self._refresh(force)
 
-        im = self._backing_image.crop(box=self._crop_box())
+    def _refresh(self, force=False, due=None):
+        """
+        Refreshes the viewport, only redrawing the hotspots whose ids are in
+        ``due`` (and any which have finished rendering late) if given.
+        """
+        window = self._crop_box()
+        visible = self._visible_hotspots(window)
+        finished = self._finish_late()
+        pending = [(hotspot, xy) for hotspot, xy in visible if self._is_due(hotspot, finished, due)]
+
+        if not (pending or self._dirty or self._moved or force):
+            return
+
+        key = (window, self._generation)
+        if not (pending or self._dirty or force) and key in self._frame_cache:
+            # The backing image may now lack hotspot parts that were clipped
+            # away, until the next time a whole window is composited
+            self._frame_cache.move_to_end(key)
+            self._stale = True
+            self._send(self._frame_cache[key], window, self._exposed_strips(window) is not None)
+            return
+
+        if pending:
+            self._invalidate()
+
+        # Each hotspot is rendered once, however many times it was added
+        redraw = list({id(hotspot): hotspot for hotspot, _ in pending
+                       if id(hotspot) not in finished}.values())
+        if redraw:
+            self._render(redraw)
+            # Hotspots over budget keep their previous content for now
+            pending = [(hotspot, xy) for hotspot, xy in pending if id(hotspot) not in self._late]
+
+        # If only the position changed, the previous frame can be shifted and
+        # just the newly exposed strips need to be copied from the backing image
+        exposed = None if self._dirty or force else self._exposed_strips(window)
+        regions = [window] if exposed is None else exposed
+
+        # Hotspots are only composited where visible, so once the viewport
+        # moves, the newly exposed parts are filled in from the last render
+        redrawn = set(pending)
+        for hotspot, xy in visible:
+            im = self._rendered.get(id(hotspot))
+            if im is None:
+                continue
+            if (hotspot, xy) in redrawn:
+                self._paste_visible(im, xy, window)
+            elif self._moved or (self._stale and exposed is None):
+                for region in regions:
+                    self._paste_visible(im, xy, region)
+
+        if exposed is None:
+            frame = self._crop(window)
+            self._stale = False
+        else:
+            dx, dy = window[0] - self._frame_window[0], window[1] - self._frame_window[1]
+            frame = Image.new(self._frame.mode, self._frame.size)
+            frame.paste(self._frame, (-dx, -dy))
+            exposed += [_intersect(calc_bounds(xy, hotspot), window) for hotspot, xy in pending]
+            for region in exposed:
+                frame.paste(self._crop(region), (region[0] - window[0], region[1] - window[1]))
+
+        if self._frame_cache_size:
+            self._frame_cache[(window, self._generation)] = frame
+            if len(self._frame_cache) > self._frame_cache_size:
+                self._frame_cache.popitem(last=False)
+        # The device can only scroll if nothing but the exposed strips changed
+        self._send(frame, window, exposed is not None and not pending)
+
+    def _send(self, frame, window, can_scroll):
+        previous, self._frame, self._frame_window = self._frame_window, frame, window
+        self._dirty = self._moved = False
+        if can_scroll:
+            dx, dy = window[0] - previous[0], window[1] - previous[1]
+            if (dx or dy) and _hardware_scroll(self._device, dx, dy, frame):
+                return
+        self._device.display(frame)
+
+    def _crop(self, box):
+        """
+        Crops ``box`` from the backing image, dithered if required.
+        """
+        if not self._dither:
+            return self._backing_image.crop(box=box)
+
+        if self._dithered is None:
+            self._dithered = self._backing_image.convert(self._device.mode)
+        else:
+            for region in self._undithered:
+                im = self._backing_image.crop(box=region).convert(self._device.mode)
+                self._dithered.paste(im, region[:2])
+        self._undithered.clear()
+        return self._dithered.crop(box=box)
+
+    def _exposed_strips(self, window):
+        """
+        The parts of ``window`` which were not in the previously sent frame,
+        or ``None`` if that frame cannot be reused.
+        """
+        if self._frame is None:
+            return None
+
+        dx, dy = window[0] - self._frame_window[0], window[1] - self._frame_window[1]
+        left, top, right, bottom = window
+        if abs(dx) >= right - left or abs(dy) >= bottom - top:
+            return None
+
+        strips = []
+        if dx > 0:
+            strips.append((right - dx, top, right, bottom))
+        elif dx < 0:
+            strips.append((left, top, left - dx, bottom))
+        if dy > 0:
+            strips.append((left, bottom - dy, right, bottom))
+        elif dy < 0:
+            strips.append((left, top, right, top - dy))
+        return strips
+
+    def _paste_visible(self, im, xy, window):
+        x, y = xy
+        box = _intersect((x, y, x + im.width, y + im.height), window)
+        if box is None:
+            return
+
+        left, top, right, bottom = box
+        if box != (x, y, x + im.width, y + im.height):
+            im = im.crop((left - x, top - y, right - x, bottom - y))
+        self._backing_image.paste(im, (left, top))
         if self._dither:
-            im = im.convert(self._device.mode)
+            self._undithered.append(box)
+
+    def _render(self, hotspots):
+        if len(hotspots) == 1 and not self._processes and self._budget is None:
+            self._finish(hotspots[0], hotspots[0].render(self.mode))
+            return
+
+        # Render each hotspot into its own buffer in parallel, then composite
+        # them here so only one thread touches the backing image
+        if self._processes:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(max_workers=self._processes)
+            futures = {self._process_pool.submit(_render_shared, hotspot, self.mode,
+                                                 self._shared_buffer(hotspot)[0].name): hotspot
+                       for hotspot in hotspots}
+        else:
+            pool = self._get_pool()
+            # Not add_task: another user of a shared pool should not wait
+            # for (or see the exceptions of) this viewport's late renders
+            futures = {pool.submit(hotspot.render, self.mode): hotspot for hotspot in hotspots}
+
+        done, not_done = wait(futures, timeout=self._budget)
+        for future in futures:
+            hotspot = futures[future]
+            if future in done:
+                self._finish(hotspot, future.result())
+            else:
+                self._timing(hotspot).overruns += 1
+                self._late[id(hotspot)] = (hotspot, future)
+                future.add_done_callback(self._wake_scheduler)
+
+    def _finish(self, hotspot, result):
+        """
+        Keeps the image rendered by ``hotspot`` (or, from a worker process,
+        its updated state) and records how long it took.
+        """
+        if self._processes:
+            vars(hotspot).update(result)
+            shm, length = self._shared_buffer(hotspot)
+            im = Image.frombytes(self.mode, hotspot.size, bytes(shm.buf[:length]))
+        elif self._budget is not None:
+            # The buffer would be drawn over by a render that runs late
+            im = result.copy()
+        else:
+            im = result
+        self._rendered[id(hotspot)] = im
+
+        elapsed = vars(hotspot).get("_render_time")
+        if elapsed is not None:
+            self._timing(hotspot).add(elapsed)
+
+    def _finish_late(self):
+        """
+        Collects the hotspots which have finished rendering since running
+        over budget, returning their ids.
+        """
+        finished = set()
+        for key, (hotspot, future) in list(self._late.items()):
+            if future.done():
+                del self._late[key]
+                self._finish(hotspot, future.result())
+                finished.add(key)
+        return finished
+
+    def _is_due(self, hotspot, finished, due=None):
+        if id(hotspot) in finished:
+            return True
+        if due is not None and id(hotspot) not in due:
+            return False
+        return id(hotspot) not in self._late and hotspot.should_redraw()
+
+    def _wake_scheduler(self, future):
+        if self._scheduler is not None:
+            self._scheduler.wake()
+
+    def _timing(self, hotspot):
+        if id(hotspot) not in self._timings:
+            self._timings[id(hotspot)] = (hotspot, _render_timing())
+        return self._timings[id(hotspot)][1]
+
+    def render_timings(self):
+        """
+        Returns how long each hotspot took to render: the ``count`` of
+        renders, the ``last``, ``mean`` and ``p99`` (over the most recent
+        1000) times in seconds, the number of ``overruns`` of the budget, and
+        whether the hotspot is ``late`` (still rendering after running over
+        budget).
+
+        :returns: The timings, keyed by hotspot.
+        :rtype: dict
+
+        .. versionadded:: 2.5.0
+        """
+        return {hotspot: timing.summary(id(hotspot) in self._late)
+                for hotspot, timing in self._timings.values()}
 
-        self._device.display(im)
+    def _shared_buffer(self, hotspot):
+        key = (id(hotspot), hotspot.size)
+        if key not in self._shared_buffers:
+            # Only on Python 3.8+, so imported when process rendering is used
+            from multiprocessing import shared_memory
+
+            length = len(Image.new(self.mode, hotspot.size).tobytes())
+            self._shared_buffers[key] = (shared_memory.SharedMemory(create=True, size=length), length)
+        return self._shared_buffers[key]
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._owns_pool = bool(self._num_threads)
+            self._pool = threadpool(self._num_threads) if self._num_threads else shared_pool()
+        return self._pool
 
     def _crop_box(self):
         (left, top) = self._position
@@ -161,12 +727,42 @@ class hotspot(mixin.capabilities):
         self.capabilities(width, height, rotate=0)  # TODO: set mode?
         self._fn = draw_fn
 
-    def paste_into(self, image, xy):
-        im = Image.new(image.mode, self.size)
+    def __getstate__(self):
+        # The off-screen buffer is not worth sending to worker processes
+        state = dict(vars(self))
+        state.pop("_buffer", None)
+        return state
+
+    def render(self, mode):
+        """
+        Renders the hotspot into its off-screen buffer, which is kept between
+        calls (and cleared before drawing) rather than being allocated for
+        every frame. Hotspots render into their own buffers, so several can
+        render in parallel without contending for a shared image. The time
+        taken is reported by :py:func:`viewport.render_timings`.
+
+        :param mode: The color model of the image.
+        :type mode: str
+        :returns: The buffer, which is only valid until the next call.
+        :rtype: PIL.Image.Image
+
+        .. versionadded:: 2.5.0
+        """
+        start = perf_counter()
+        im = vars(self).get("_buffer")
+        if im is None or im.mode != mode or im.size != self.size:
+            im = self._buffer = Image.new(mode, self.size)
+        else:
+            im.paste(0, (0, 0) + im.size)
+
         draw = ImageDraw.Draw(im)
         self.update(draw)
-        image.paste(im, xy)
         del draw
+        self._render_time = perf_counter() - start
+        return im
+
+    def paste_into(self, image, xy):
+        image.paste(self.render(image.mode), xy)
 
     def should_redraw(self):
         """
@@ -176,6 +772,18 @@ class hotspot(mixin.capabilities):
         """
         return True
 
+    def next_redraw(self):
+        """
+        Override this method to return the time (as given by
+        :py:func:`luma.core.util.perf_counter`) at which the hotspot will next
+        need redrawing, so a :py:class:`refresh_scheduler` can wake up for it.
+        ``None`` (the default) means the hotspot only redraws when the
+        viewport is otherwise refreshed.
+
+        .. versionadded:: 2.5.0
+        """
+        return None
+
     def update(self, draw):
         if self._fn:
             self._fn(draw, self.width, self.height)
@@ -199,9 +807,148 @@ class snapshot(hotspot):
         """
         return perf_counter() - self.last_updated > self.interval
 
-    def paste_into(self, image, xy):
-        super(snapshot, self).paste_into(image, xy)
+    def next_redraw(self):
+        """
+        Due ``interval`` seconds after the last update.
+        """
+        return self.last_updated + self.interval
+
+    def render(self, mode):
+        im = super(snapshot, self).render(mode)
         self.last_updated = perf_counter()
+        return im
+
+
+class refresh_scheduler(object):
+    """
+    Refreshes a viewport when its hotspots are due to be redrawn (see
+    :py:func:`hotspot.next_redraw`), rather than relying on the application to
+    call :py:func:`viewport.refresh` in a loop. Deadlines are kept on a heap,
+    so the scheduler sleeps until the next one is due, and hotspots falling
+    due within ``coalesce`` seconds of each other are redrawn in a single
+    refresh. An idle dashboard of snapshots therefore only wakes when one of
+    them needs updating::
+
+        scheduler = refresh_scheduler(virtual)
+        threading.Thread(target=scheduler.run, daemon=True).start()
+
+    Scheduled refreshes only redraw the hotspots that are due (and any that
+    ran over the viewport's ``budget`` and have since finished); plain
+    hotspots, which have no deadline, are only redrawn when the application
+    refreshes the viewport itself. The scheduler and the viewport's methods
+    share a lock, so the application may carry on adding and removing
+    hotspots and moving the viewport while the scheduler runs in another
+    thread (or it can call :py:func:`run_pending` from its own loop instead).
+
+    :param viewport: The viewport to refresh.
+    :type viewport: viewport
+    :param coalesce: Hotspots due up to this many seconds after the earliest
+        one are redrawn in the same refresh (default: 0.05).
+    :type coalesce: float
+    :param recheck: How long to wait before checking again on a hotspot that
+        was due but was not redrawn, e.g. because it is not visible
+        (default: 1.0).
+    :type recheck: float
+
+    .. versionadded:: 2.5.0
+    """
+    def __init__(self, viewport, coalesce=0.05, recheck=1.0):
+        self._viewport = viewport
+        self.coalesce = coalesce
+        self.recheck = recheck
+        self._heap = []
+        self._sequence = count()
+        self._wake = Event()
+        self._stopped = False
+        viewport._scheduler = self
+        for hotspot, xy in viewport._hotspots:
+            self.schedule(hotspot, xy)
+
+    def schedule(self, hotspot, xy):
+        """
+        Adds a hotspot at ``(x, y)`` on the viewport to the schedule; this is
+        done automatically for hotspots added to the viewport.
+        """
+        deadline = hotspot.next_redraw()
+        if deadline is not None:
+            with self._viewport._lock:
+                heapq.heappush(self._heap, (deadline, next(self._sequence), hotspot, xy))
+            self.wake()
+
+    def wake(self):
+        """
+        Makes :py:func:`run` check the schedule again straight away, e.g.
+        when a hotspot that was over budget has finished rendering.
+        """
+        self._wake.set()
+
+    def run_pending(self):
+        """
+        Refreshes the viewport if any hotspots are due, and reschedules them.
+
+        :returns: The number of seconds until the next hotspot is due, or
+            ``None`` if nothing is scheduled.
+        :rtype: float
+        """
+        # Anything which wakes the scheduler from here on is picked up below,
+        # or cuts short the wait in run
+        self._wake.clear()
+        viewport = self._viewport
+        batch = []
+        with viewport._lock:
+            if any(future.done() for _, future in viewport._late.values()):
+                viewport._refresh(due=set())
+
+            now = perf_counter()
+            if self._heap and self._heap[0][0] <= now:
+                horizon = self._heap[0][0] + self.coalesce
+                while self._heap and self._heap[0][0] <= horizon:
+                    batch.append(heapq.heappop(self._heap))
+
+        if batch:
+            # Wait (without holding the lock) for the rest of the batch
+            latest = max(deadline for deadline, _, _, _ in batch)
+            if latest > now:
+                self._wake.wait(latest - now)
+
+            with viewport._lock:
+                if self._stopped:
+                    for entry in batch:
+                        heapq.heappush(self._heap, entry)
+                    return None
+
+                viewport._refresh(due={id(hotspot) for _, _, hotspot, _ in batch})
+
+                now = perf_counter()
+                for deadline, _, hotspot, xy in batch:
+                    if (hotspot, xy) not in viewport._hotspots:
+                        continue
+                    deadline = hotspot.next_redraw()
+                    if deadline is None:
+                        continue
+                    if deadline <= now:
+                        deadline = now + self.recheck
+                    heapq.heappush(self._heap, (deadline, next(self._sequence), hotspot, xy))
+
+        with viewport._lock:
+            return max(0, self._heap[0][0] - now) if self._heap else None
+
+    def run(self):
+        """
+        Runs the schedule until :py:func:`stop` is called.
+        """
+        self._stopped = False
+        while not self._stopped:
+            delay = self.run_pending()
+            if not self._stopped and (delay is None or delay > 0):
+                self._wake.wait(delay)
+
+    def stop(self):
+        """
+        Makes :py:func:`run` return.
+        """
+        self._stopped = True
+        self._wake.set()
 
 
 class terminal(object):
@@ -230,6 +977,7 @@ class terminal(object):
         self.height = device.height // self._ch
         self.size = (self.width, self.height)
         self.reset()
+        self._unflushed = False
         self._backing_image = Image.new(self._device.mode, self._device.size,
             self._bgcolor)
         self._canvas = ImageDraw.Draw(self._backing_image)
@@ -355,7 +1103,12 @@ class terminal(object):
         """
         Advances the cursor position ot the left hand side, and to the next
         line. If the cursor is on the lowest line, the displayed contents are
-        scrolled, causing the top line to be lost.
+        scrolled, causing the top line to be lost. Devices which support
+        hardware scrolling (see :py:func:`luma.core.mixin.capabilities.can_scroll`)
+        are asked to scroll themselves rather than being sent a whole frame,
+        provided the device is already showing everything written so far
+        (which, unless ``animate`` is set, is not the case after text has
+        been written on the current line).
         """
         self.carriage_return()
 
@@ -366,10 +1119,16 @@ class terminal(object):
             self._backing_image.paste(copy, (0, 0))
             self._canvas.rectangle((0, copy.height, self._device.width,
                 self._device.height), fill=self.default_bgcolor)
+
+            # Let the device scroll its contents instead, if it can; it only
+            # sends the exposed line, so must already show the rest
+            if self._unflushed or not _hardware_scroll(self._device, 0, self._ch,
+                                                       self._backing_image):
+                self.flush()
         else:
             self._cy += self._ch
+            self.flush()
 
-        self.flush()
         if self.animate:
             sleep(0.2)
 
@@ -392,12 +1151,14 @@ class terminal(object):
         """
         bounds = (self._cx, self._cy, self._cx + self._cw, self._cy + self._ch)
         self._canvas.rectangle(bounds, fill=self._bgcolor)
+        self._unflushed = True
 
     def flush(self):
         """
         Cause the current backing store to be rendered on the nominated device.
         """
         self._device.display(self._backing_image)
+        self._unflushed = False
 
     def foreground_color(self, value):
         """
@@ -7,12 +7,15 @@ Test helpers.
 """
 
 import platform
+import time
 from pathlib import Path
 
 import pytest
-from PIL import ImageChops, ImageFont
+from PIL import Image, ImageChops, ImageFont
 from unittest.mock import mock_open
 
+from luma.core.device import dummy
+
 
 rpi_gpio_missing = f'RPi.GPIO is not supported on this platform: {platform.system()}'
 spidev_missing = f'spidev is not supported on this platform: {platform.system()}'
@@ -125,3 +128,107 @@ def assert_only_cleans_whats_setup(gpio):
     pins_set_up = {args[0] for args in setups}
     pins_clean = {args[0] for args in setups}
     assert pins_clean == pins_set_up, f"set pins {pins_set_up} but cleaned pins {pins_clean}"
+
+
+class fake_ftdi(object):
+    """
+    Stands in for a :py:class:`pyftdi.ftdi.Ftdi` in MPSSE mode, recording
+    every USB write. An optional per-write ``usb_latency`` (in seconds) can be
+    given to approximate real hardware when benchmarking throughput.
+    """
+    def __init__(self, usb_latency=0):
+        self.usb_latency = usb_latency
+        self.writes = []
+        self.frequency = None
+        self.latency_timer = 1
+        self.chunk_size = 1024
+
+    def set_latency_timer(self, latency):
+        self.latency_timer = latency
+
+    def write_data_set_chunksize(self, chunksize=0):
+        self.chunk_size = chunksize or 1024
+
+    def set_frequency(self, frequency):
+        self.frequency = frequency
+        return frequency
+
+    def write_data(self, data):
+        self.writes.append(bytes(data))
+        if self.usb_latency:
+            time.sleep(self.usb_latency)
+        return len(data)
+
+    @property
+    def bytes_written(self):
+        return sum(len(w) for w in self.writes)
+
+
+class fake_ftdi_gpio(object):
+
+    def __init__(self, controller, width=8):
+        self._controller = controller
+        self.width = width
+
+    def set_direction(self, pins, direction):
+        self._controller.direction &= ~pins
+        self._controller.direction |= pins & direction
+
+
+class fake_ftdi_spi_controller(object):
+    """
+    Stands in for a :py:class:`pyftdi.spi.SpiController` (with one chip
+    select on AD3) so that the FTDI SPI interface can be exercised and
+    benchmarked without hardware.
+    """
+    def __init__(self, cs_count=1, usb_latency=0):
+        self.ftdi = fake_ftdi(usb_latency)
+        self.direction = 0x0B  # SCLK, MOSI, CS0 as outputs
+        self.url = None
+        self.terminated = False
+
+    def configure(self, url, **kwargs):
+        self.url = url
+
+    def get_port(self, cs, freq=None, mode=0):
+        return object()
+
+    def get_gpio(self):
+        return fake_ftdi_gpio(self)
+
+    def terminate(self):
+        self.terminated = True
+
+
+class scrolling_dummy(dummy):
+    """
+    A dummy device which claims hardware scroll support, and records the
+    scroll requests it receives. Like a real controller, scrolling shifts
+    what it already shows and only takes the newly exposed strips from the
+    new image, so anything else that changed is lost.
+    """
+    def __init__(self, *args, **kwargs):
+        super(scrolling_dummy, self).__init__(*args, **kwargs)
+        self.scrolls = []
+
+    def can_scroll(self, dx, dy):
+        return True
+
+    def scroll(self, dx, dy, image):
+        self.scrolls.append((dx, dy))
+        image = self.preprocess(image)
+        width, height = self.image.size
+        shifted = Image.new(self.image.mode, self.image.size)
+        shifted.paste(self.image, (-dx, -dy))
+        strips = []
+        if dx > 0:
+            strips.append((width - dx, 0, width, height))
+        elif dx < 0:
+            strips.append((0, 0, -dx, height))
+        if dy > 0:
+            strips.append((0, height - dy, width, height))
+        elif dy < 0:
+            strips.append((0, 0, width, -dy))
+        for strip in strips:
+            shifted.paste(image.crop(strip), strip[:2])
+        self.image = shifted
@@ -268,6 +268,25 @@ def test_make_interface_pcf8574():
             factory.pcf8574()
 
 
+def test_make_interface_tca9548a():
+    """
+    :py:func:`luma.core.cmdline.make_interface.tca9548a` returns a tca9548a instance.
+    """
+    class opts:
+        i2c_port = 200
+        i2c_address = 0x3C
+        mux_channel = 3
+        mux_address = '0x70'
+
+    path_name = f'/dev/i2c-{opts.i2c_port}'
+    fake_open = i2c_error(path_name, errno.ENOENT)
+    factory = cmdline.make_interface(opts)
+
+    with patch('os.open', fake_open):
+        with pytest.raises(error.DeviceNotFoundError):
+            factory.tca9548a()
+
+
 def test_make_interface_bitbang_6800():
     """
     :py:func:`luma.core.cmdline.make_interface.bitbang_6800` returns a Bitbang-6800 instance.
@@ -52,6 +52,24 @@ def test_data(mock_controller):
     port.write_to.assert_called_once_with(0x40, data)
 
 
+@patch('pyftdi.i2c.I2cController')
+def test_data_single_transaction(mock_controller):
+    data = bytearray(128 * 64 // 8 * 4)
+    port = Mock()
+    instance = Mock()
+    instance.get_port = Mock(return_value=port)
+    mock_controller.side_effect = [instance]
+
+    serial = ftdi_i2c(device='ftdi://dummy', address=0x3C)
+    serial.command(0x21, 0, 127)
+    serial.data(data)
+    assert port.write_to.call_count == 2
+    assert port.write_to.call_args[0][0] == 0x40
+    assert port.write_to.call_args[0][1] is data
+    assert serial.stats(reset=True) == {"transactions": 2, "bytes": 4 + len(data) + 1}
+    assert serial.stats() == {"transactions": 0, "bytes": 0}
+
+
 @patch('pyftdi.i2c.I2cController')
 def test_cleanup(mock_controller):
     port = Mock()
@@ -7,9 +7,12 @@
 Tests for the :py:class:`luma.core.interface.serial.ftdi_spi` class.
 """
 
-from unittest.mock import Mock, call, patch
+from unittest.mock import Mock, patch
+
+import pytest
+
 from luma.core.interface.serial import ftdi_spi
-from helpers import fib, assert_only_cleans_whats_setup
+from helpers import fib, assert_only_cleans_whats_setup, fake_ftdi_spi_controller
 
 
 @patch('pyftdi.spi.SpiController')
@@ -17,6 +20,7 @@ def test_init(mock_controller):
     gpio = Mock()
     gpio.width = 8
     instance = Mock()
+    instance.direction = 0x6B
     instance.get_port = Mock()
     instance.get_gpio = Mock(return_value=gpio)
     mock_controller.side_effect = [instance]
@@ -29,38 +33,113 @@ def test_init(mock_controller):
     gpio.set_direction.assert_called_with(0x60, 0x60)
 
 
+@patch('pyftdi.spi.SpiController')
+def test_reset(mock_controller):
+    controller = fake_ftdi_spi_controller()
+    mock_controller.side_effect = [controller]
+
+    ftdi_spi(device='ftdi://dummy', bus_speed_hz=16000000, gpio_CS=3, gpio_DC=5, gpio_RST=6)
+    # RST pulsed low then high, each in its own USB write; CS (AD3) held high
+    assert controller.ftdi.writes == [
+        bytes([0x80, 0x08, 0x6B]),
+        bytes([0x80, 0x48, 0x6B])]
+    assert controller.ftdi.frequency == 16000000
+
+
 @patch('pyftdi.spi.SpiController')
 def test_command(mock_controller):
     cmds = [3, 1, 4, 2]
-    gpio = Mock()
-    gpio.width = 8
-    port = Mock()
-    instance = Mock()
-    instance.get_port = Mock(return_value=port)
-    instance.get_gpio = Mock(return_value=gpio)
-    mock_controller.side_effect = [instance]
+    controller = fake_ftdi_spi_controller()
+    mock_controller.side_effect = [controller]
 
     serial = ftdi_spi(device='ftdi://dummy', bus_speed_hz=16000000, gpio_CS=3, gpio_DC=5, gpio_RST=6)
+    del controller.ftdi.writes[:]
     serial.command(*cmds)
-    gpio.write.assert_has_calls([call(0x00), call(0x40), call(0x40)])
-    port.write.assert_called_once_with(cmds)
+    assert controller.ftdi.writes == [bytes([
+        0x80, 0x48, 0x6B,  # DC low
+        0x80, 0x40, 0x6B,  # CS low
+        0x11, 0x03, 0x00, 3, 1, 4, 2,
+        0x80, 0x48, 0x6B])]  # CS high
 
 
 @patch('pyftdi.spi.SpiController')
 def test_data(mock_controller):
-    data = list(fib(100))
-    gpio = Mock()
-    gpio.width = 8
-    port = Mock()
-    instance = Mock()
-    instance.get_port = Mock(return_value=port)
-    instance.get_gpio = Mock(return_value=gpio)
-    mock_controller.side_effect = [instance]
+    data = list(fib(10))
+    controller = fake_ftdi_spi_controller()
+    mock_controller.side_effect = [controller]
 
     serial = ftdi_spi(device='ftdi://dummy', bus_speed_hz=16000000, gpio_CS=3, gpio_DC=5, gpio_RST=6)
+    del controller.ftdi.writes[:]
     serial.data(data)
-    gpio.write.assert_has_calls([call(0x00), call(0x40), call(0x60)])
-    port.write.assert_called_once_with(data)
+    assert controller.ftdi.writes == [bytes([
+        0x80, 0x68, 0x6B,  # DC high
+        0x80, 0x60, 0x6B,  # CS low
+        0x11, 0x09, 0x00] + data + [
+        0x80, 0x68, 0x6B])]  # CS high
+
+
+@patch('pyftdi.spi.SpiController')
+def test_data_large_frame(mock_controller):
+    # ILI9341 320x240 RGB565 frame
+    data = bytes(320 * 240 * 2)
+    controller = fake_ftdi_spi_controller()
+    mock_controller.side_effect = [controller]
+
+    serial = ftdi_spi(device='ftdi://dummy', bus_speed_hz=30000000, gpio_CS=3, gpio_DC=5, gpio_RST=6)
+    assert serial._transfer_size == 65536
+    del controller.ftdi.writes[:]
+    with serial.transaction():
+        serial.data(data)
+    assert len(controller.ftdi.writes) == 1
+    # three MPSSE write commands, each framed by chip select changes
+    assert controller.ftdi.bytes_written == len(data) + 3 * (3 + 3 + 3) + 3
+
+
+@patch('pyftdi.spi.SpiController')
+def test_usb_settings(mock_controller):
+    controller = fake_ftdi_spi_controller()
+    mock_controller.side_effect = [controller]
+
+    serial = ftdi_spi(device='ftdi://dummy', transfer_size=8192, usb_latency_timer=4, usb_chunk_size=4096)
+    assert serial._transfer_size == 8192
+    assert controller.ftdi.latency_timer == 4
+    assert controller.ftdi.chunk_size == 4096
+
+
+@patch('pyftdi.spi.SpiController')
+def test_transaction(mock_controller):
+    controller = fake_ftdi_spi_controller()
+    mock_controller.side_effect = [controller]
+
+    serial = ftdi_spi(device='ftdi://dummy', bus_speed_hz=16000000, gpio_CS=3, gpio_DC=5, gpio_RST=6)
+    del controller.ftdi.writes[:]
+    with serial.transaction():
+        for _ in range(10):
+            serial.command(0x2A, 0, 0, 0, 127)
+            serial.data(list(range(256)))
+        assert controller.ftdi.writes == []
+    assert len(controller.ftdi.writes) == 1
+
+
+@patch('pyftdi.spi.SpiController')
+def test_failed_write_is_not_resent(mock_controller):
+    controller = fake_ftdi_spi_controller()
+    mock_controller.side_effect = [controller]
+
+    serial = ftdi_spi(device='ftdi://dummy', bus_speed_hz=16000000, gpio_CS=3, gpio_DC=5, gpio_RST=6)
+    del controller.ftdi.writes[:]
+    write_data = controller.ftdi.write_data
+    controller.ftdi.write_data = Mock(side_effect=IOError)
+    with pytest.raises(IOError):
+        serial.command(1)
+
+    controller.ftdi.write_data = write_data
+    serial.command(2)
+    assert controller.ftdi.writes == [bytes([
+        0x80, 0x48, 0x6B,  # DC low
+        0x80, 0x40, 0x6B,  # CS low
+        0x11, 0x00, 0x00, 2,
+        0x80, 0x48, 0x6B])]  # CS high
 
 
 @patch('pyftdi.spi.SpiController')
@@ -69,6 +148,7 @@ def test_cleanup(mock_controller):
     gpio.width = 8
     port = Mock()
     instance = Mock()
+    instance.direction = 0x6B
     instance.get_port = Mock(return_value=port)
     instance.get_gpio = Mock(return_value=gpio)
     mock_controller.side_effect = [instance]
@@ -66,7 +66,7 @@ def test_command():
     serial.command(*cmds)
     verify_gpio_cs_spi_init(9, 1)
     gpio.output.assert_has_calls([call(25, gpio.HIGH), call(24, gpio.LOW), call(23, gpio.LOW), call(23, gpio.HIGH)])
-    spidev.writebytes.assert_called_once_with(cmds)
+    spidev.writebytes2.assert_called_once_with(cmds)
 
 
 def test_data():
@@ -75,7 +75,53 @@ def test_data():
     serial.data(data)
     verify_gpio_cs_spi_init(9, 1)
     gpio.output.assert_has_calls([call(25, gpio.HIGH), call(24, gpio.HIGH), call(23, gpio.LOW), call(23, gpio.HIGH)])
-    spidev.writebytes.assert_called_once_with(data)
+    spidev.writebytes2.assert_called_once_with(data)
+
+
+def test_data_chunked():
+    data = list(fib(10))
+    serial = gpio_cs_spi(gpio=gpio, spi=spidev, port=9, device=1, gpio_CS=23, transfer_size=4)
+    gpio.output.reset_mock()
+    serial.data(data)
+    assert gpio.output.call_args_list == [
+        call(24, gpio.HIGH),
+        call(23, gpio.LOW), call(23, gpio.HIGH),
+        call(23, gpio.LOW), call(23, gpio.HIGH),
+        call(23, gpio.LOW), call(23, gpio.HIGH)]
+    assert [bytes(c[0][0]) for c in spidev.writebytes2.call_args_list] == [bytes(data[0:4]), bytes(data[4:8]), bytes(data[8:10])]
+
+
+def test_data_hold_cs():
+    data = list(fib(10))
+    serial = gpio_cs_spi(gpio=gpio, spi=spidev, port=9, device=1, gpio_CS=23, transfer_size=4, hold_cs=True)
+    gpio.output.reset_mock()
+    serial.data(data)
+    assert gpio.output.call_args_list == [call(23, gpio.LOW), call(24, gpio.HIGH), call(23, gpio.HIGH)]
+    assert [bytes(c[0][0]) for c in spidev.writebytes2.call_args_list] == [bytes(data[0:4]), bytes(data[4:8]), bytes(data[8:10])]
+
+
+def test_transaction():
+    serial = gpio_cs_spi(gpio=gpio, spi=spidev, port=9, device=1, gpio_CS=23, cs_high=True)
+    gpio.output.reset_mock()
+    with serial.transaction():
+        serial.command(0x2C)
+        with serial.transaction():
+            serial.data([1, 2, 3])
+    assert gpio.output.call_args_list == [
+        call(23, gpio.HIGH),
+        call(24, gpio.LOW),
+        call(24, gpio.HIGH),
+        call(23, gpio.LOW)]
+    assert spidev.writebytes2.call_args_list == [call([0x2C]), call([1, 2, 3])]
+
+
+def test_transaction_without_cs():
+    serial = gpio_cs_spi(gpio=gpio, spi=spidev, port=9, device=1, hold_cs=True)
+    gpio.output.reset_mock()
+    with serial.transaction():
+        serial.data([1, 2, 3])
+    gpio.output.assert_called_once_with(24, gpio.HIGH)
+    spidev.writebytes2.assert_called_once_with([1, 2, 3])
 
 
 def test_cleanup():
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Tests for the :py:class:`luma.core.interface.instrument.instrumented` class.
+"""
+
+from unittest.mock import Mock, call
+
+from luma.core.device import parallel_device
+from luma.core.interface.instrument import instrumented
+
+
+def test_passes_through():
+    serial = Mock(unsafe=True)
+    wrapped = instrumented(serial)
+    wrapped.command(1, 2, 3)
+    wrapped.data([4, 5])
+    wrapped.cleanup()
+    serial.command.assert_called_once_with(1, 2, 3)
+    serial.data.assert_called_once_with([4, 5])
+    serial.cleanup.assert_called_once_with()
+
+
+def test_delegates_attributes():
+    serial = Mock(unsafe=True)
+    serial._bitmode = 4
+    serial._pulse_time = 0
+    pd = parallel_device(serial_interface=instrumented(serial))
+    pd.command(0x10)
+    serial.command.assert_has_calls([call(0x01, 0x00)])
+
+
+def test_counters():
+    serial = Mock(unsafe=True)
+    wrapped = instrumented(serial)
+    for _ in range(3):
+        wrapped.command(0x15, 0, 127)
+        wrapped.command(0x75, 0, 127)
+        wrapped.data(bytes(1024))
+        wrapped.frame()
+
+    stats = wrapped.stats()
+    assert stats["command"]["transactions"] == 6
+    assert stats["command"]["bytes"] == 18
+    assert stats["data"]["transactions"] == 3
+    assert stats["data"]["bytes"] == 3072
+    assert stats["data"]["p50"] <= stats["data"]["p99"]
+    assert stats["mode_switches"] == 5
+    assert stats["frames"] == 3
+    assert stats["transactions_per_frame"] == 3
+
+    wrapped.reset()
+    stats = wrapped.stats()
+    assert stats["data"]["transactions"] == 0
+    assert stats["data"]["p50"] is None
+    assert stats["data"]["bytes_per_second"] is None
+    assert stats["transactions_per_frame"] is None
+
+
+def test_prometheus():
+    wrapped = instrumented(Mock(unsafe=True))
+    wrapped.command(1)
+    wrapped.data([1, 2, 3])
+    text = wrapped.prometheus(labels={"display": "oled"})
+    lines = text.splitlines()
+    assert 'luma_serial_transactions_total{display="oled",kind="command"} 1' in lines
+    assert 'luma_serial_bytes_total{display="oled",kind="data"} 3' in lines
+    assert 'luma_serial_transfer_seconds_bucket{display="oled",kind="data",le="+Inf"} 1' in lines
+    assert 'luma_serial_transfer_seconds_count{display="oled",kind="data"} 1' in lines
+    assert 'luma_serial_mode_switches_total{display="oled"} 1' in lines
+    assert lines.count("# TYPE luma_serial_transfer_seconds histogram") == 1
+
+
+def test_export(tmp_path):
+    wrapped = instrumented(Mock(unsafe=True))
+    wrapped.data([1, 2, 3])
+    path = tmp_path / "luma.prom"
+    wrapped.export(str(path))
+    assert path.read_text() == wrapped.prometheus()
+    assert list(tmp_path.iterdir()) == [path]
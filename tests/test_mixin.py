@@ -3,13 +3,93 @@
 # Copyright (c) 2017-18 Richard Hull and contributors
 # See LICENSE.rst for details.
 
+import asyncio
+import threading
+from unittest.mock import Mock
 
 import pytest
+from PIL import Image
 
-from luma.core.mixin import capabilities
+from luma.core.device import dummy
+from luma.core.interface.instrument import instrumented
+from luma.core.interface.serial import noop
+from luma.core.interface.simulator import bus
+from luma.core.mixin import asynchronous, bus_executor, capabilities, run_on_bus
 
 
 def test_display_not_implemented():
     cap = capabilities()
     with pytest.raises(NotImplementedError):
         cap.display('foo')
+
+
+def test_bus_executor_per_interface():
+    serial = noop()
+    assert bus_executor(serial) is bus_executor(serial)
+    assert bus_executor(serial) is not bus_executor(noop())
+
+
+def test_async_interface_runs_on_bus_thread():
+    calls = []
+
+    class serial(asynchronous):
+        def command(self, *cmd):
+            calls.append(("command", cmd, threading.current_thread().name))
+
+        def data(self, data):
+            calls.append(("data", data, threading.current_thread().name))
+
+    async def run(interface):
+        await interface.command_async(1, 2)
+        await interface.data_async([3])
+
+    asyncio.run(run(serial()))
+    assert [call[:2] for call in calls] == [("command", (1, 2)), ("data", [3])]
+    assert calls[0][2] == calls[1][2]
+    assert calls[0][2].startswith("luma-bus")
+
+
+def test_device_display_async():
+    device = dummy(width=16, height=8, mode="1")
+    image = Image.new("1", (16, 8), 1)
+    asyncio.run(device.display_async(image))
+    assert device.image.tobytes() == image.tobytes()
+
+
+def test_cancel_before_transfer_starts():
+    serial = noop()
+    release = threading.Event()
+    sent = []
+
+    async def run():
+        busy = asyncio.ensure_future(run_on_bus(serial, release.wait))
+        queued = asyncio.ensure_future(run_on_bus(serial, sent.append, "frame"))
+        await asyncio.sleep(0.01)
+        queued.cancel()
+        await asyncio.sleep(0.01)
+        release.set()
+        await busy
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+
+    asyncio.run(run())
+    assert sent == []
+
+
+def test_scroll_defaults_to_display():
+    cap = capabilities()
+    cap.display = Mock()
+    assert cap.can_scroll(0, 8) is False
+    cap.scroll(0, 8, 'image')
+    cap.display.assert_called_once_with('image')
+
+
+def test_wrappers_count_async_transfers():
+    serial = instrumented(noop())
+    asyncio.run(serial.data_async([1, 2, 3]))
+    assert serial.stats()["data"]["transactions"] == 1
+    assert bus_executor(serial) is bus_executor(serial._serial_interface)
+
+    simulated = bus(bus_speed_hz=1000000)
+    asyncio.run(simulated.command_async(0xAF))
+    assert simulated.stats()["transactions"] == 1
@@ -21,7 +21,7 @@ def test_4bit():
     pd.data([0x41, 0x42, 0x43])
 
     comm = call(0x01, 0x00, 0x01, 0x01, 0x0f, 0x0f)
-    data = call([0x04, 0x01, 0x04, 0x02, 0x04, 0x03])
+    data = call(bytearray([0x04, 0x01, 0x04, 0x02, 0x04, 0x03]))
     serial.command.assert_has_calls([comm])
     serial.data.assert_has_calls([data])
 
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Tests for the :py:class:`luma.core.interface.serial.recorder` class.
+"""
+
+import io
+from unittest.mock import Mock
+
+from luma.core.interface.serial import recorder
+from luma.core.interface.simulator import read_recording
+
+
+def test_passes_through():
+    serial = Mock(unsafe=True)
+    rec = recorder(io.BytesIO(), serial)
+    rec.command(0xAF)
+    rec.data([1, 2, 3])
+    rec.cleanup()
+    serial.command.assert_called_once_with(0xAF)
+    serial.data.assert_called_once_with([1, 2, 3])
+    serial.cleanup.assert_called_once_with()
+
+
+def test_log_format():
+    fp = io.BytesIO()
+    rec = recorder(fp)
+    rec.command(0x15, 0, 127)
+    rec.data(bytearray(range(10)))
+    rec.frame()
+    rec.cleanup()
+
+    assert fp.getvalue().startswith(recorder.MAGIC)
+    fp.seek(0)
+    records = list(read_recording(fp))
+    assert [(kind, payload) for kind, _, payload in records] == [
+        (recorder.COMMAND, bytes([0x15, 0, 127])),
+        (recorder.DATA, bytes(range(10))),
+        (recorder.FRAME, b""),
+    ]
+    timestamps = [ts for _, ts, _ in records]
+    assert timestamps == sorted(timestamps)
+
+
+def test_records_to_path(tmp_path):
+    path = str(tmp_path / "test.rec")
+    rec = recorder(path)
+    rec.command(0xAE)
+    rec.cleanup()
+
+    assert [kind for kind, _, _ in read_recording(path)] == [recorder.COMMAND]
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Tests for the :py:class:`luma.core.interface.scheduler.shared_bus` class.
+"""
+
+import errno
+
+import pytest
+import smbus2
+from unittest.mock import Mock, patch, call
+
+import luma.core.error
+from luma.core.interface.scheduler import shared_bus
+
+from helpers import i2c_error
+
+
+def test_init_device_not_found():
+    path_name = '/dev/i2c-200'
+    with patch('os.open', i2c_error(path_name, errno.ENOENT)):
+        with pytest.raises(luma.core.error.DeviceNotFoundError):
+            shared_bus(port=200)
+
+
+def test_selects_channel_only_when_it_changes():
+    smbus = Mock(unsafe=True)
+    shared = shared_bus(bus=smbus)
+    left = shared.interface(address=0x3C, channel=0)
+    right = shared.interface(address=0x3C, channel=1)
+
+    left.command(0xAE)
+    left.data([1, 2, 3])
+    right.command(0xAE)
+    left.command(0xAF)
+
+    assert smbus.mock_calls == [
+        call.write_byte(0x70, 0x01),
+        call.write_i2c_block_data(0x3C, 0x00, [0xAE]),
+        call.write_i2c_block_data(0x3C, 0x40, [1, 2, 3]),
+        call.write_byte(0x70, 0x02),
+        call.write_i2c_block_data(0x3C, 0x00, [0xAE]),
+        call.write_byte(0x70, 0x01),
+        call.write_i2c_block_data(0x3C, 0x00, [0xAF]),
+    ]
+    assert shared.stats()["mux_switches"] == 3
+
+
+def test_unmuxed_device():
+    smbus = Mock(unsafe=True)
+    shared = shared_bus(bus=smbus)
+    shared.interface(address=0x3D).command(0xAE)
+    smbus.write_byte.assert_not_called()
+
+
+def test_managed_bus_uses_large_blocks():
+    with patch.object(smbus2.SMBus, 'open'), \
+            patch.object(smbus2.SMBus, 'i2c_rdwr') as rdwr, \
+            patch.object(smbus2.SMBus, 'write_byte'), \
+            patch.object(smbus2.SMBus, 'close') as close:
+        shared = shared_bus(port=1)
+        serial = shared.interface(channel=2)
+        serial.data(list(range(100)))
+        serial.cleanup()
+        close.assert_not_called()
+        shared.cleanup()
+        close.assert_called_once_with()
+
+    assert rdwr.call_count == 1
+    assert len(rdwr.call_args[0][0]) == 101
+
+
+def test_per_display_stats():
+    shared = shared_bus(bus=Mock(unsafe=True))
+    shared.interface(address=0x3C, channel=0).data(list(range(10)))
+    shared.interface(address=0x3D, name="status").command(0xAE, 0xAF)
+
+    displays = shared.stats()["displays"]
+    assert displays["0:0x3C"]["transactions"] == 1
+    assert displays["0:0x3C"]["bytes"] == 11
+    assert displays["0:0x3C"]["channel"] == 0
+    assert displays["status"]["bytes"] == 3
+
+
+def test_run_pending_order():
+    shared = shared_bus(bus=Mock(unsafe=True))
+    ran = []
+    shared.submit(ran.append, "no deadline")
+    shared.submit(ran.append, "late", deadline=20)
+    shared.submit(ran.append, "early", deadline=10)
+    shared.submit(ran.append, "urgent", deadline=20, priority=5)
+
+    assert shared.run_pending() == 4
+    assert ran == ["early", "urgent", "late", "no deadline"]
+    assert shared.run_pending() == 0
+
+
+def test_submit_replaces_pending_frame():
+    shared = shared_bus(bus=Mock(unsafe=True))
+    device = object()
+    ran = []
+    shared.submit(ran.append, "frame 1", key=device)
+    shared.submit(ran.append, "other", deadline=5)
+    shared.submit(ran.append, "frame 2", key=device)
+
+    shared.run_pending()
+    assert ran == ["other", "frame 2"]
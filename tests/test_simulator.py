@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Tests for the :py:mod:`luma.core.interface.simulator` module.
+"""
+
+import io
+
+import pytest
+
+from luma.core.interface.serial import recorder
+from luma.core.interface.simulator import bus, i2c_bus, spi_bus, replay
+
+
+def record(*calls):
+    fp = io.BytesIO()
+    rec = recorder(fp)
+    for name, args in calls:
+        getattr(rec, name)(*args)
+    fp.seek(0)
+    return fp
+
+
+def test_bus_timing():
+    sim = bus(bus_speed_hz=8000, latency=0.001)
+    sim.command(1, 2)
+    sim.data(bytes(998))
+    sim.frame()
+    stats = sim.stats()
+    assert stats["transactions"] == 2
+    assert stats["bytes"] == 1000
+    assert stats["elapsed"] == pytest.approx(0.002 + 1.0)
+    assert stats["fps"] == pytest.approx(1 / 1.002)
+
+
+def test_bus_reset():
+    sim = bus(bus_speed_hz=400000)
+    assert sim.stats()["fps"] is None
+    sim.data([1, 2, 3])
+    sim.reset()
+    assert sim.stats()["bytes"] == 0
+
+
+def test_replay_with_frame_markers():
+    fp = record(
+        ("command", (0x15, 0, 127)), ("data", ([0] * 100,)), ("frame", ()),
+        ("command", (0x15, 0, 127)), ("data", ([0] * 100,)), ("frame", ()))
+    sim = bus(bus_speed_hz=32000000)
+    result = replay(fp, sim)
+    assert result["frames"] == 2
+    assert sim.stats()["frames"] == 2
+    assert sim.stats()["bytes"] == 206
+
+
+def test_replay_infers_frames():
+    fp = record(
+        ("command", (0xAF,)), ("command", (0x15,)), ("data", ([0] * 10,)),
+        ("command", (0x15,)), ("data", ([0] * 10,)))
+    sim = bus(bus_speed_hz=400000)
+    assert replay(fp, sim)["frames"] == 2
+    assert sim.stats()["transactions"] == 5
+
+
+def test_replay_empty():
+    fp = record()
+    assert replay(fp, bus(bus_speed_hz=400000)) == {"frames": 0, "recorded_time": 0.0}
+
+
+def test_replay_rejects_other_files():
+    with pytest.raises(AssertionError):
+        replay(io.BytesIO(b"not a recording"), bus(bus_speed_hz=400000))
+
+
+def test_i2c_bus_overheads():
+    sim = i2c_bus(bus_speed_hz=100000)
+    sim.command(0xAF)
+    # start/stop + address + control + 1 byte payload, 9 clocks per byte
+    assert sim.elapsed == pytest.approx((2 + 3 * 9) / 100000)
+
+
+def test_i2c_bus_blocks():
+    small = i2c_bus(block_size=32)
+    large = i2c_bus(block_size=4096)
+    small.data(bytes(1024))
+    large.data(bytes(1024))
+    assert small.elapsed - large.elapsed == pytest.approx(31 * 20 / 400000)
+
+
+def test_spi_bus_overheads():
+    sim = spi_bus(bus_speed_hz=1000000, transfer_size=100, cs_gap=0.001, dc_setup=0.01)
+    sim.command(1, 2)
+    assert sim.elapsed == pytest.approx(0.001 + 0.01 + 16 / 1000000)
+    sim.reset()
+    sim.data(bytes(250))
+    sim.data(bytes(10))
+    assert sim.elapsed == pytest.approx(4 * 0.001 + 0.01 + 260 * 8 / 1000000)
+
+
+def test_min_fps():
+    sim = bus(bus_speed_hz=8)
+    sim.data([0])
+    sim.frame()
+    sim.data([0, 0])
+    sim.frame()
+    stats = sim.stats()
+    assert stats["fps"] == pytest.approx(2 / 3)
+    assert stats["min_fps"] == pytest.approx(0.5)
@@ -8,9 +8,9 @@ Tests for the :py:class:`luma.core.interface.serial.spi` class.
 """
 
 import pytest
-from unittest.mock import Mock, call
+from unittest.mock import Mock, call, patch
 
-from luma.core.interface.serial import spi
+from luma.core.interface.serial import spi, _spidev_bufsiz
 import luma.core.error
 
 from helpers import get_spidev, rpi_gpio_missing, fib, assert_only_cleans_whats_setup
@@ -65,7 +65,7 @@ def test_command():
     serial.command(*cmds)
     verify_spi_init(9, 1)
     gpio.output.assert_has_calls([call(25, gpio.HIGH), call(24, gpio.LOW)])
-    spidev.writebytes.assert_called_once_with(cmds)
+    spidev.writebytes2.assert_called_once_with(cmds)
 
 
 def test_data():
@@ -74,7 +74,70 @@ def test_data():
     serial.data(data)
     verify_spi_init(9, 1)
     gpio.output.assert_has_calls([call(25, gpio.HIGH), call(24, gpio.HIGH)])
-    spidev.writebytes.assert_called_once_with(data)
+    spidev.writebytes2.assert_called_once_with(data)
+
+
+def test_data_single_write_when_within_transfer_size():
+    data = bytes(fib(10))
+    with patch('luma.core.interface.serial._spidev_bufsiz', return_value=65536):
+        serial = spi(gpio=gpio, spi=spidev, port=9, device=1)
+    assert serial._transfer_size == 65536
+    serial.data(data)
+    spidev.writebytes2.assert_called_once_with(data)
+
+
+def test_data_chunked_uses_memoryview_slices():
+    data = bytearray(range(10))
+    serial = spi(gpio=gpio, spi=spidev, port=9, device=1, transfer_size=4)
+    serial.data(data)
+    chunks = [c[0][0] for c in spidev.writebytes2.call_args_list]
+    assert all(isinstance(chunk, memoryview) for chunk in chunks)
+    assert [bytes(chunk) for chunk in chunks] == [data[0:4], data[4:8], data[8:10]]
+
+
+def test_data_chunked_list():
+    data = list(range(10))
+    serial = spi(gpio=gpio, spi=spidev, port=9, device=1, transfer_size=8)
+    serial.data(data)
+    chunks = [bytes(c[0][0]) for c in spidev.writebytes2.call_args_list]
+    assert chunks == [bytes(data[0:8]), bytes(data[8:10])]
+
+
+def test_frame_buffer_reused():
+    serial = spi(gpio=gpio, spi=spidev, port=9, device=1)
+    buf = serial.frame_buffer(16)
+    assert isinstance(buf, memoryview)
+    assert len(buf) == 16
+    buf[:] = bytes(range(16))
+
+    smaller = serial.frame_buffer(8)
+    assert smaller.obj is buf.obj
+    assert bytes(smaller) == bytes(range(8))
+
+    larger = serial.frame_buffer(32)
+    assert len(larger) == 32
+    assert larger.obj is not buf.obj
+
+
+def test_data_frame_buffer_passed_through():
+    serial = spi(gpio=gpio, spi=spidev, port=9, device=1, transfer_size=4096)
+    buf = serial.frame_buffer(100)
+    buf[:] = bytes(range(100))
+    serial.data(buf)
+    spidev.writebytes2.assert_called_once_with(buf)
+
+
+def test_transfer_size_fallback():
+    with patch('luma.core.interface.serial._spidev_bufsiz', return_value=None):
+        serial = spi(gpio=gpio, spi=spidev, port=9, device=1)
+    assert serial._transfer_size == 4096
+
+
+def test_spidev_bufsiz(tmp_path):
+    bufsiz = tmp_path / "bufsiz"
+    bufsiz.write_text("65536\n")
+    assert _spidev_bufsiz(str(bufsiz)) == 65536
+    assert _spidev_bufsiz(str(tmp_path / "missing")) is None
 
 
 def test_cleanup():
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Tests for the :py:class:`luma.core.interface.serial.tca9548a` class.
+"""
+
+import pytest
+from unittest.mock import Mock, call
+
+from luma.core.interface.scheduler import shared_bus
+from luma.core.interface.serial import tca9548a
+import luma.core.error
+
+
+def test_skips_redundant_channel_select():
+    smbus = Mock(unsafe=True)
+    left = tca9548a(channel=0, bus=smbus)
+    right = tca9548a(channel=5, bus=smbus, address=0x3D)
+
+    left.command(0xAE)
+    left.data([1, 2])
+    right.data([3])
+    right.data([4])
+
+    assert smbus.mock_calls == [
+        call.write_byte(0x70, 0x01),
+        call.write_i2c_block_data(0x3C, 0x00, [0xAE]),
+        call.write_i2c_block_data(0x3C, 0x40, [1, 2]),
+        call.write_byte(0x70, 0x20),
+        call.write_i2c_block_data(0x3D, 0x40, [3]),
+        call.write_i2c_block_data(0x3D, 0x40, [4]),
+    ]
+    assert left.bus is right.bus
+
+    left.cleanup()
+    right.cleanup()
+
+
+def test_shared_bus_supplied():
+    shared = shared_bus(bus=Mock(unsafe=True), mux_address=0x71)
+    serial = tca9548a(channel=2, bus=shared)
+    serial.command(0xAF)
+    shared.bus.write_byte.assert_called_once_with(0x71, 0x04)
+    serial.cleanup()
+    shared.bus.close.assert_not_called()
+
+
+def test_closes_bus_after_last_cleanup():
+    shared = shared_bus(bus=Mock(unsafe=True))
+    shared._managed = True
+    key = (id(shared.bus), 0x70)
+    tca9548a._shared_buses[key] = [shared, 0]
+
+    first = tca9548a(channel=0, bus=shared.bus)
+    second = tca9548a(channel=1, bus=shared.bus)
+    first.cleanup()
+    shared.bus.close.assert_not_called()
+    second.cleanup()
+    shared.bus.close.assert_called_once_with()
+    assert key not in tca9548a._shared_buses
+
+
+def test_invalid_channel():
+    with pytest.raises(AssertionError):
+        tca9548a(channel=8, bus=Mock(unsafe=True))
+
+
+def test_invalid_address():
+    with pytest.raises(luma.core.error.DeviceAddressError):
+        tca9548a(channel=0, bus=shared_bus(bus=Mock(unsafe=True)), address='foo')
+
+
+def test_scan():
+    smbus = Mock(unsafe=True)
+    present = {(0, 0x3C), (3, 0x3C), (3, 0x3D)}
+    shared = shared_bus(bus=smbus)
+
+    def read_byte(address):
+        if (shared.channel, address) not in present:
+            raise OSError(121, "Remote I/O error")
+        return 0
+
+    smbus.read_byte.side_effect = read_byte
+    found = shared.scan()
+    assert found == {0: [0x3C], 1: [], 2: [], 3: [0x3C, 0x3D], 4: [], 5: [], 6: [], 7: []}
+    assert 0x70 not in [c[0][0] for c in smbus.read_byte.call_args_list]
+    assert smbus.write_byte.call_count == 8
@@ -7,13 +7,15 @@
 Tests for the :py:class:`luma.core.virtual.terminal` class.
 """
 
+from unittest.mock import patch
+
 from PIL import Image
 
 from luma.core.device import dummy
 from luma.core.virtual import terminal
 
 from helpers import (get_reference_image, assert_identical_image,
-    get_reference_font)
+    get_reference_font, scrolling_dummy)
 
 
 def assert_text(device, term, reference_img, text, save=None):
@@ -143,3 +145,29 @@ def test_accented_charset():
     assert_text(device, term, reference, [
         u"\033[31mFußgängerunterführungen\033[0m Текст на русском"
     ])
+
+
+def test_hardware_scroll():
+    device = scrolling_dummy(width=64, height=32)
+    term = terminal(device, animate=True)
+    with patch("luma.core.virtual.sleep"):
+        for i in range(term.height + 2):
+            term.println(str(i))
+    assert device.scrolls
+    assert all(scroll == (0, term._ch) for scroll in device.scrolls)
+    assert device.image.tobytes() == term._backing_image.tobytes()
+
+
+def test_hardware_scroll_unflushed():
+    device = scrolling_dummy(width=64, height=32)
+    term = terminal(device, animate=False)
+    for i in range(term.height + 2):
+        term.println(str(i))
+    # The lines written were never on the device to be scrolled
+    assert device.scrolls == []
+    assert device.image.tobytes() == term._backing_image.tobytes()
+
+    # Blank lines can be scrolled onto the device
+    term.println()
+    assert device.scrolls == [(0, term._ch)]
+    assert device.image.tobytes() == term._backing_image.tobytes()
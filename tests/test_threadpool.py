@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Tests for the :py:class:`luma.core.threadpool.threadpool` class.
+"""
+
+import threading
+
+import pytest
+
+from luma.core.threadpool import threadpool
+
+
+def test_runs_all_tasks():
+    results = []
+    with threadpool(2) as pool:
+        for i in range(20):
+            pool.add_task(results.append, i)
+        pool.wait_completion()
+    assert sorted(results) == list(range(20))
+
+
+def test_add_task_does_not_block():
+    release = threading.Event()
+    with threadpool(1) as pool:
+        futures = [pool.add_task(release.wait) for _ in range(5)]
+        assert not any(future.done() for future in futures)
+        release.set()
+        pool.wait_completion()
+        assert all(future.result() for future in futures)
+
+
+def test_exception_propagates_to_wait_completion():
+    def fail():
+        raise ValueError("boom")
+
+    results = []
+    with threadpool(2) as pool:
+        pool.add_task(fail)
+        pool.add_task(results.append, 1)
+        with pytest.raises(ValueError, match="boom"):
+            pool.wait_completion()
+
+        # The pool is still usable afterwards
+        pool.add_task(results.append, 2)
+        pool.wait_completion()
+    assert sorted(results) == [1, 2]
+
+
+def test_timings():
+    class task(object):
+        def run(self):
+            pass
+
+    a, b = task(), task()
+    with threadpool(2, timed=True) as pool:
+        pool.add_task(a.run)
+        pool.add_task(a.run)
+        pool.add_task(b.run)
+        pool.wait_completion()
+
+        timings = pool.timings(reset=True)
+        assert timings[a.run]["count"] == 2
+        assert timings[b.run]["count"] == 1
+        assert timings[a.run]["max"] <= timings[a.run]["total"]
+        assert pool.timings() == {}
+
+
+def test_untimed_by_default():
+    with threadpool(1) as pool:
+        pool.add_task(lambda: None)
+        pool.wait_completion()
+        assert pool.timings() == {}
+
+
+def test_cancelled_task():
+    release = threading.Event()
+    with threadpool(1) as pool:
+        pool.add_task(release.wait)
+        assert pool.add_task(lambda: None).cancel()
+        release.set()
+        pool.wait_completion()
+
+
+def test_add_task_after_cancel():
+    release = threading.Event()
+    with threadpool(1) as pool:
+        pool.add_task(release.wait)
+        pool.add_task(lambda: None).cancel()
+        future = pool.add_task(release.is_set)
+        release.set()
+        assert future.result()
+        pool.wait_completion()
+
+
+def test_submit_is_not_waited_for():
+    def fail():
+        raise ValueError("boom")
+
+    with threadpool(1) as pool:
+        future = pool.submit(fail)
+        pool.wait_completion()
+        with pytest.raises(ValueError):
+            future.result()
+
+
+def test_shutdown():
+    pool = threadpool(1)
+    pool.shutdown()
+    with pytest.raises(RuntimeError):
+        pool.add_task(lambda: None)
+
+
+def test_completed_tasks_are_not_kept():
+    with threadpool(1) as pool:
+        for _ in range(10):
+            pool.add_task(lambda: None).result()
+        assert len(pool._pending) == 1
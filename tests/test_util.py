@@ -43,7 +43,7 @@ def test_from_16_to_8_to_16():
     expect = [0, 1, 0, 2, 0, 3, 0x80, 0, 0xFF, 0xFF]
 
     result = util.from_16_to_8(data)
-    assert result == expect
+    assert result == bytearray(expect)
 
     expect = [1, 2, 3, -32768, -1]
     result = util.from_8_to_16(result)
@@ -58,4 +58,31 @@ def test_bytes_to_nibbles():
     expect = [0, 0, 0, 1, 0, 2, 0, 3, 15, 15, 7, 15]
 
     result = util.bytes_to_nibbles(data)
-    assert result == expect
+    assert result == bytearray(expect)
+
+
+def test_from_16_to_8_negative():
+    """
+    Negative values are truncated to their two's complement 16 bit form
+    """
+    data = [-1, -32768, -2]
+    expect = [0xFF, 0xFF, 0x80, 0x00, 0xFF, 0xFE]
+
+    result = util.from_16_to_8(data)
+    assert result == bytearray(expect)
+    assert util.from_8_to_16(result) == data
+
+
+def test_from_8_to_16_none():
+    assert util.from_8_to_16(None) is None
+
+
+def test_bytes_to_nibbles_all_values():
+    """
+    Every byte value expands to the same nibble pair as the naive conversion
+    """
+    data = bytes(range(256))
+    expect = [f(x) for x in data for f in (lambda x: x >> 4, lambda x: 0x0F & x)]
+
+    assert list(util.bytes_to_nibbles(data)) == expect
+    assert list(util.bytes_to_nibbles(tuple(data))) == expect
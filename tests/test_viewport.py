@@ -8,16 +8,23 @@ Tests for the :py:class:`luma.core.virtual.viewport` class and associated
 helpers.
 """
 
+import random
+import subprocess
+import sys
+import threading
 import time
+from unittest.mock import Mock, patch
 
+import pytest
 from PIL import Image
 
 from luma.core.device import dummy
 from luma.core.render import canvas
-from luma.core.virtual import range_overlap, hotspot, snapshot, viewport
+from luma.core.threadpool import threadpool
+from luma.core.virtual import range_overlap, hotspot, snapshot, viewport, refresh_scheduler, shared_pool
 
 import baseline_data
-from helpers import get_reference_image, assert_identical_image
+from helpers import get_reference_image, assert_identical_image, scrolling_dummy
 
 
 def overlap(box1, box2):
@@ -165,3 +172,559 @@ def test_viewport_dithering():
         virtual.remove_hotspot(widget, (19, 56))
 
         assert_identical_image(reference, device.image, img_path)
+
+
+def test_viewport_pool_is_lazy():
+    # A fresh interpreter, so that no other test has created the shared pool
+    code = ("import threading, luma.core.virtual as v; "
+            "assert v._shared_pool is None; "
+            "print(threading.active_count())")
+    out = subprocess.check_output([sys.executable, "-c", code])
+    assert out.strip() == b"1"
+
+
+def test_viewport_single_hotspot_renders_inline():
+    pool = Mock()
+    device = dummy()
+    virtual = viewport(device, 200, 200, pool=pool)
+    virtual.add_hotspot(hotspot(10, 10), (0, 0))
+    virtual.refresh()
+    pool.add_task.assert_not_called()
+    pool.submit.assert_not_called()
+
+
+def test_viewport_own_pool():
+    device = dummy()
+    drawn = []
+    virtual = viewport(device, 200, 200, num_threads=2)
+    for i in range(3):
+        virtual.add_hotspot(hotspot(10, 10, lambda draw, w, h: drawn.append(w)), (i * 10, 0))
+    virtual.refresh()
+
+    assert len(drawn) == 3
+    assert isinstance(virtual._pool, threadpool)
+    assert virtual._pool.num_threads == 2
+    assert virtual._pool is not shared_pool()
+
+    pool = virtual._pool
+    virtual.cleanup()
+    assert virtual._pool is None
+    with pytest.raises(RuntimeError):
+        pool.add_task(lambda: None)
+
+
+def test_viewport_shared_pool():
+    pool = threadpool(2, timed=True)
+    device = dummy()
+    first = viewport(device, 200, 200, pool=pool)
+    second = viewport(device, 200, 200, pool=pool)
+    for virtual in (first, second):
+        virtual.add_hotspot(hotspot(10, 10), (0, 0))
+        virtual.add_hotspot(hotspot(10, 10), (10, 0))
+        virtual.refresh()
+
+    assert len(pool.timings()) == 4
+    pool.shutdown()
+
+
+def draw_stripes(draw, width, height):
+    for x in range(0, width, 2):
+        draw.line((x, 0, x, height), fill="white")
+
+
+def test_viewport_process_pool():
+    threaded = viewport(dummy(mode="RGB"), 200, 200, num_threads=2)
+    processes = viewport(dummy(mode="RGB"), 200, 200, processes=2)
+    widgets = [snapshot(20, 10, draw_stripes, interval=60) for _ in range(3)]
+    for virtual in (threaded, processes):
+        for i, widget in enumerate(widgets):
+            virtual.add_hotspot(widget, (i * 20, 0))
+
+    threaded.refresh()
+    for widget in widgets:
+        widget.last_updated = -60
+    processes.refresh()
+
+    assert processes._device.image.tobytes() == threaded._device.image.tobytes()
+    # state changed while rendering in the worker is copied back
+    assert all(widget.last_updated > 0 for widget in widgets)
+    assert len(processes._shared_buffers) == 3
+
+    processes.remove_hotspot(widgets[0], (0, 0))
+    assert len(processes._shared_buffers) == 2
+    processes.cleanup()
+    assert processes._process_pool is None
+    assert processes._shared_buffers == {}
+
+
+class gauge(object):
+    def __init__(self):
+        self.value = 0
+
+    def draw(self, draw, width, height):
+        draw.rectangle((0, 0, self.value, height), fill="white")
+
+
+def test_viewport_process_pool_reads_current_state():
+    model = gauge()
+    widget = hotspot(20, 10, model.draw)
+    virtual = viewport(dummy(mode="RGB", width=32, height=16), 32, 16, processes=1)
+    virtual.add_hotspot(widget, (0, 0))
+    virtual.refresh()
+    assert widget._fn.__self__ is model
+
+    model.value = 8
+    virtual.refresh()
+    assert virtual._device.image.getbbox() == (0, 0, 9, 10)
+    virtual.cleanup()
+
+
+def test_hotspot_reuses_buffer():
+    calls = []
+    widget = hotspot(10, 10, lambda draw, w, h: calls.append(draw.im))
+    first = widget.render("RGB")
+    first.putpixel((0, 0), (255, 0, 0))
+    second = widget.render("RGB")
+    assert first is second
+    assert second.getpixel((0, 0)) == (0, 0, 0)
+    assert widget.render("1") is not first
+    assert len(calls) == 3
+
+
+def test_viewport_parallel_matches_inline():
+    inline = dummy(mode="RGB")
+    parallel = dummy(mode="RGB")
+    for device, count in ((inline, 1), (parallel, 3)):
+        virtual = viewport(device, 200, 200, num_threads=3)
+        for i in range(count):
+            virtual.add_hotspot(hotspot(20, 10, draw_stripes), (i * 20, 0))
+        virtual.refresh()
+
+    left = (0, 0, 20, 10)
+    assert inline.image.crop(left).tobytes() == parallel.image.crop(left).tobytes()
+    assert parallel.image.crop((20, 0, 60, 10)).getbbox() is not None
+
+
+def test_viewport_skips_unchanged_refresh():
+    device = Mock(width=128, height=64, mode="1")
+    virtual = viewport(device, 200, 200)
+    widget = snapshot(10, 10, draw_stripes, interval=60)
+    virtual.add_hotspot(widget, (0, 0))
+
+    virtual.refresh()
+    virtual.refresh()
+    virtual.set_position((0, 0))
+    assert device.display.call_count == 1
+
+    virtual.set_position((1, 0))
+    assert device.display.call_count == 2
+    virtual.refresh(force=True)
+    assert device.display.call_count == 3
+
+
+def test_viewport_clips_hotspot_to_visible_area():
+    device = dummy(width=20, height=10, mode="1")
+    virtual = viewport(device, 60, 10)
+    widget = snapshot(20, 10, lambda draw, w, h: draw.rectangle((0, 0, w, h), fill="white"),
+                      interval=60)
+    virtual.add_hotspot(widget, (10, 0))
+    virtual.refresh()
+
+    # Only the visible half of the hotspot was composited...
+    assert virtual._backing_image.getbbox() == (10, 0, 20, 10)
+
+    # ...and the rest is filled in from the last render once it scrolls in,
+    # without redrawing the snapshot
+    virtual.set_position((10, 0))
+    assert virtual._backing_image.getbbox() == (10, 0, 30, 10)
+    assert device.image.getbbox() == (0, 0, 20, 10)
+
+
+def test_viewport_spatial_index():
+    device = dummy(width=128, height=64)
+    virtual = viewport(device, 1024, 1024)
+    tiles = {}
+    for y in range(0, 1024, 32):
+        for x in range(0, 1024, 32):
+            tiles[(x, y)] = hotspot(32, 32)
+            virtual.add_hotspot(tiles[(x, y)], (x, y))
+
+    visible = virtual._visible_hotspots((100, 100, 228, 164))
+    expected = [(tiles[(x, y)], (x, y)) for y in range(96, 164, 32) for x in range(96, 228, 32)]
+    assert visible == expected
+
+    virtual.remove_hotspot(tiles[(96, 96)], (96, 96))
+    assert (tiles[(96, 96)], (96, 96)) not in virtual._visible_hotspots((100, 100, 228, 164))
+
+
+def test_viewport_hotspot_position_as_list():
+    virtual = viewport(dummy(width=32, height=16), 64, 16)
+    widget = hotspot(8, 8, draw_stripes)
+    virtual.add_hotspot(widget, [4, 4])
+    assert (widget, (4, 4)) in virtual._hotspots
+    virtual.remove_hotspot(widget, [4, 4])
+    assert virtual._hotspots == {}
+
+
+def test_viewport_remove_missing_hotspot():
+    virtual = viewport(dummy(), 200, 200)
+    with pytest.raises(ValueError):
+        virtual.remove_hotspot(hotspot(10, 10), (0, 0))
+
+
+def test_viewport_scroll_reuses_frame():
+    random.seed(4)
+    device = dummy(width=32, height=16, mode="RGB")
+    virtual = viewport(device, 128, 64)
+    content = Image.new("RGB", virtual.size)
+    content.putdata([(random.randrange(256), 0, 0) for _ in range(128 * 64)])
+    virtual.display(content)
+    virtual.add_hotspot(hotspot(20, 10, draw_stripes), (40, 20))
+
+    for xy in [(3, 0), (3, 5), (0, 2), (40, 20), (96, 48), (95, 47)]:
+        virtual.set_position(xy)
+        expected = virtual._backing_image.crop(virtual._crop_box())
+        assert device.image.tobytes() == expected.tobytes(), xy
+
+
+def test_viewport_scroll_to():
+    device = Mock(width=32, height=16, mode="1")
+    virtual = viewport(device, 128, 64)
+    positions = []
+    virtual.set_position = Mock(side_effect=positions.append)
+    virtual.scroll_to((10, 5), step=4)
+    assert positions == [(3, 1), (6, 3), (10, 5)]
+
+
+def test_viewport_hardware_scroll():
+    device = scrolling_dummy(width=32, height=16, mode="RGB")
+    virtual = viewport(device, 128, 64)
+    virtual.add_hotspot(hotspot(20, 10, draw_stripes), (40, 20))
+    virtual.refresh()
+    virtual.set_position((2, 3))
+    virtual.set_position((90, 3))
+    virtual.set_position((89, 3))
+
+    # The jump was too far to scroll
+    assert device.scrolls == [(2, 3), (-1, 0)]
+    assert device.image.tobytes() == virtual._backing_image.crop(virtual._crop_box()).tobytes()
+
+
+def test_viewport_hardware_scroll_only_when_just_moving():
+    device = scrolling_dummy(width=32, height=16, mode="RGB")
+    virtual = viewport(device, 128, 16)
+    frames = iter(range(1, 100))
+    virtual.add_hotspot(hotspot(8, 8, lambda draw, w, h: draw.line((0, 0, next(frames), 0), fill="white")), (4, 4))
+    virtual.refresh()
+
+    # Redrawn in place: nothing to scroll
+    virtual.refresh()
+    assert device.scrolls == []
+    assert device.image.tobytes() == virtual._backing_image.crop(virtual._crop_box()).tobytes()
+
+    # Redrawn while moving: the redraw is not in an exposed strip
+    virtual.set_position((2, 0))
+    assert device.scrolls == []
+    assert device.image.tobytes() == virtual._backing_image.crop(virtual._crop_box()).tobytes()
+
+
+def test_viewport_frame_cache():
+    device = dummy(width=32, height=16, mode="RGB")
+    virtual = viewport(device, 128, 16, frame_cache=8)
+    content = Image.new("RGB", virtual.size)
+    content.putdata([(x % 256, 0, 0) for x in range(128 * 16)])
+    virtual.display(content)
+
+    for x in range(4):
+        virtual.set_position((x, 0))
+    assert len(virtual._frame_cache) == 4
+
+    frames = []
+    with patch.object(device, "display", side_effect=frames.append):
+        virtual.set_position((0, 0))
+        virtual.set_position((1, 0))
+    assert frames[0] is virtual._frame_cache[((0, 0, 32, 16), virtual._generation)]
+    assert frames[1].tobytes() == content.crop((1, 0, 33, 16)).tobytes()
+
+    # A change of content discards the cache
+    virtual.add_hotspot(hotspot(8, 8, draw_stripes), (0, 0))
+    assert len(virtual._frame_cache) == 0
+
+
+def test_viewport_frame_cache_lru():
+    device = dummy(width=32, height=16)
+    virtual = viewport(device, 128, 16, frame_cache=2)
+    for x in (0, 1, 2, 1, 3):
+        virtual.set_position((x, 0))
+    assert [key[0][0] for key in virtual._frame_cache] == [1, 3]
+
+
+def test_viewport_dither_is_stable_when_scrolling():
+    device = dummy(width=32, height=16, mode="1")
+    virtual = viewport(device, 64, 16, mode="RGB", dither=True)
+    virtual.display(Image.new("RGB", virtual.size, (128, 128, 128)))
+
+    first = device.image.copy()
+    virtual.set_position((5, 0))
+    # The same virtual pixels come out the same wherever the window is
+    assert device.image.crop((0, 0, 27, 16)).tobytes() == first.crop((5, 0, 32, 16)).tobytes()
+
+
+def test_viewport_dither_is_incremental():
+    device = dummy(width=32, height=16, mode="1")
+    virtual = viewport(device, 64, 16, mode="RGB", dither=True)
+    virtual.add_hotspot(hotspot(8, 8, draw_stripes), (4, 4))
+    virtual.refresh()
+
+    with patch.object(Image.Image, "convert", autospec=True, side_effect=Image.Image.convert) as convert:
+        virtual.refresh()
+    assert [call[0][0].size for call in convert.call_args_list] == [(8, 8)]
+
+
+def test_refresh_scheduler_coalesces_due_hotspots():
+    device = dummy(width=32, height=16)
+    device.display = Mock(wraps=device.display)
+    virtual = viewport(device, 32, 16)
+    drawn = []
+    plain = hotspot(8, 8, lambda draw, w, h: drawn.append(w))
+    first, second, third = (snapshot(8, 8, draw_stripes, interval=60) for _ in range(3))
+    now = time.perf_counter()
+    first.last_updated = now - 60
+    second.last_updated = now - 59.99
+    third.last_updated = now - 30
+    updated = [widget.last_updated for widget in (first, second, third)]
+
+    virtual.add_hotspot(plain, (24, 0))
+    virtual.add_hotspot(first, (0, 0))
+    scheduler = refresh_scheduler(virtual, coalesce=0.05)
+    virtual.add_hotspot(second, (8, 0))
+    virtual.add_hotspot(third, (16, 0))
+
+    # The first two are redrawn in a single refresh, and nothing else is
+    delay = scheduler.run_pending()
+    assert device.display.call_count == 1
+    assert first.last_updated > updated[0]
+    assert second.last_updated > updated[1]
+    assert third.last_updated == updated[2]
+    assert drawn == []
+    assert 29 < delay <= 30
+
+
+def test_refresh_scheduler_stop_while_coalescing():
+    virtual = viewport(dummy(width=32, height=16), 32, 16)
+    first, second = (snapshot(8, 8, draw_stripes, interval=60) for _ in range(2))
+    first.last_updated = time.perf_counter() - 60
+    second.last_updated = first.last_updated + 10
+    virtual.add_hotspot(first, (0, 0))
+    virtual.add_hotspot(second, (8, 0))
+    scheduler = refresh_scheduler(virtual, coalesce=20)
+
+    thread = threading.Thread(target=scheduler.run)
+    thread.start()
+    time.sleep(0.05)
+    scheduler.stop()
+    thread.join(timeout=1)
+    assert not thread.is_alive()
+    assert len(scheduler._heap) == 2
+
+
+def test_refresh_scheduler_alongside_the_application():
+    device = dummy(width=32, height=16)
+    virtual = viewport(device, 64, 16)
+    scheduler = refresh_scheduler(virtual)
+    thread = threading.Thread(target=scheduler.run)
+    thread.start()
+    try:
+        for i in range(50):
+            widget = snapshot(8, 8, draw_stripes, interval=0.001)
+            virtual.add_hotspot(widget, (i % 56, 0))
+            virtual.set_position((i % 32, 0))
+            virtual.remove_hotspot(widget, (i % 56, 0))
+    finally:
+        scheduler.stop()
+        thread.join(timeout=1)
+    assert not thread.is_alive()
+
+
+def test_refresh_scheduler_idle():
+    device = dummy(width=32, height=16)
+    virtual = viewport(device, 32, 16)
+    virtual.add_hotspot(hotspot(8, 8, draw_stripes), (0, 0))
+    scheduler = refresh_scheduler(virtual)
+    # Plain hotspots are never scheduled
+    assert scheduler.run_pending() is None
+
+
+def test_refresh_scheduler_drops_removed_hotspots():
+    device = dummy(width=32, height=16)
+    virtual = viewport(device, 32, 16)
+    widget = snapshot(8, 8, draw_stripes, interval=0.001)
+    virtual.add_hotspot(widget, (0, 0))
+    scheduler = refresh_scheduler(virtual)
+    virtual.remove_hotspot(widget, (0, 0))
+    assert scheduler.run_pending() is None
+
+
+def test_refresh_scheduler_rechecks_hidden_hotspots():
+    device = dummy(width=32, height=16)
+    virtual = viewport(device, 64, 16)
+    widget = snapshot(8, 8, draw_stripes, interval=0.001)
+    virtual.add_hotspot(widget, (40, 0))
+    scheduler = refresh_scheduler(virtual, recheck=10)
+    # Out of view, so not redrawn: don't spin on it
+    assert scheduler.run_pending() > 9
+    assert widget.last_updated == -0.001
+
+
+def test_refresh_scheduler_run_and_stop():
+    device = dummy(width=32, height=16)
+    virtual = viewport(device, 32, 16)
+    widget = snapshot(8, 8, draw_stripes, interval=0.01)
+    virtual.add_hotspot(widget, (0, 0))
+    scheduler = refresh_scheduler(virtual)
+
+    thread = threading.Thread(target=scheduler.run)
+    thread.start()
+    time.sleep(0.05)
+    scheduler.stop()
+    thread.join(timeout=1)
+    assert not thread.is_alive()
+    assert widget.last_updated > 0
+
+
+def test_viewport_render_timings():
+    device = dummy(width=32, height=16)
+    virtual = viewport(device, 32, 16)
+    widget = hotspot(8, 8, draw_stripes)
+    virtual.add_hotspot(widget, (0, 0))
+    for _ in range(3):
+        virtual.refresh()
+
+    timings = virtual.render_timings()[widget]
+    assert timings["count"] == 3
+    assert 0 < timings["last"] <= timings["p99"]
+    assert timings["mean"] <= timings["p99"]
+    assert timings["overruns"] == 0
+    assert not timings["late"]
+
+    virtual.remove_hotspot(widget, (0, 0))
+    assert virtual.render_timings() == {}
+
+
+def test_viewport_budget_keeps_previous_content():
+    release = threading.Event()
+    calls = []
+
+    def slow(draw, width, height):
+        calls.append(1)
+        if len(calls) > 1:
+            release.wait(5)
+        draw_stripes(draw, width, height)
+
+    device = dummy(width=32, height=16)
+    virtual = viewport(device, 32, 16, num_threads=2, budget=0.01)
+    widget = hotspot(8, 8, slow)
+    virtual.add_hotspot(widget, (0, 0))
+    fast = hotspot(8, 8, draw_stripes)
+    virtual.add_hotspot(fast, (16, 0))
+
+    virtual.refresh()
+    before = device.image.copy()
+    assert before.getbbox() == (0, 0, 23, 8)
+
+    # The slow hotspot misses its budget: it is flagged, the refresh carries
+    # on, and the display keeps its previous content
+    virtual.display(Image.new(virtual.mode, virtual.size))
+    assert virtual.render_timings()[widget]["late"]
+    assert virtual.render_timings()[widget]["overruns"] == 1
+    assert device.image.crop((0, 0, 8, 8)).getbbox() is None
+    assert device.image.crop((16, 0, 24, 8)).tobytes() == before.crop((16, 0, 24, 8)).tobytes()
+
+    # Not rendered again while still late
+    virtual.refresh()
+    assert len(calls) == 2
+
+    # Shown once it finishes
+    release.set()
+    virtual._late[id(widget)][1].result()
+    virtual.refresh()
+    assert not virtual.render_timings()[widget]["late"]
+    assert device.image.tobytes() == before.tobytes()
+    virtual.cleanup()
+
+
+def test_refresh_scheduler_shows_late_hotspots():
+    release = threading.Event()
+
+    def slow(draw, width, height):
+        release.wait(5)
+        draw_stripes(draw, width, height)
+
+    device = dummy(width=32, height=16)
+    virtual = viewport(device, 32, 16, num_threads=1, budget=0.01)
+    widget = snapshot(8, 8, slow, interval=60)
+    virtual.add_hotspot(widget, (0, 0))
+    scheduler = refresh_scheduler(virtual)
+    scheduler.run_pending()
+    assert virtual.render_timings()[widget]["late"]
+    assert device.image.getbbox() is None
+
+    thread = threading.Thread(target=scheduler.run)
+    thread.start()
+    release.set()
+    time.sleep(0.05)
+    scheduler.stop()
+    thread.join(timeout=1)
+    assert device.image.getbbox() == (0, 0, 7, 8)
+    virtual.cleanup()
+
+
+def test_viewport_display_discards_hotspot_renders():
+    device = dummy(width=20, height=10)
+    virtual = viewport(device, 60, 10)
+    virtual.add_hotspot(snapshot(20, 10, draw_stripes, interval=60), (10, 0))
+    virtual.refresh()
+    assert device.image.getbbox() is not None
+
+    virtual.display(Image.new(virtual.mode, virtual.size))
+    virtual.set_position((10, 0))
+    assert device.image.getbbox() is None
+
+
+def test_viewport_shifted_frame_after_display_is_not_torn():
+    device = scrolling_dummy(width=20, height=10)
+    virtual = viewport(device, 60, 10)
+    virtual.add_hotspot(snapshot(20, 10, draw_stripes, interval=60), (10, 0))
+    virtual.refresh()
+    virtual.display(Image.new(virtual.mode, virtual.size))
+
+    # The previous (black) frame is shifted, and the exposed strip must not
+    # bring back the hotspot's render from before the display
+    virtual.set_position((10, 0))
+    assert device.scrolls == [(10, 0)]
+    assert device.image.getbbox() is None
+
+
+def test_viewport_undithered_regions_only_kept_when_dithering():
+    virtual = viewport(dummy(width=32, height=16), 64, 16)
+    widget = hotspot(8, 8, draw_stripes)
+    for _ in range(10):
+        virtual.add_hotspot(widget, (4, 4))
+        virtual.refresh()
+        virtual.remove_hotspot(widget, (4, 4))
+    assert virtual._undithered == []
+
+
+def test_viewport_render_errors_stay_with_the_viewport():
+    def broken(draw, width, height):
+        raise ValueError("broken")
+
+    pool = threadpool(2)
+    virtual = viewport(dummy(width=32, height=16), 32, 16, pool=pool)
+    virtual.add_hotspot(hotspot(8, 8, broken), (0, 0))
+    virtual.add_hotspot(hotspot(8, 8, draw_stripes), (8, 0))
+    with pytest.raises(ValueError):
+        virtual.refresh()
+    # Other users of the pool are not affected
+    pool.wait_completion()
+    pool.shutdown()